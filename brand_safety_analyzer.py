@@ -11,73 +11,34 @@ Gemini AI를 활용한 YouTube 채널 브랜드 안전성 검사
 6. 추가 확인 사항 (Additional Checks)
 """
 
+import importlib.util
 import json
 
-# Gemini AI (선택적 import)
+# orjson (선택적 import, 없으면 표준 json 사용)
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Gemini AI (선택적 의존성 - 설치 여부만 확인하고, 무거운 import는 첫 분석 시점까지 지연)
+try:
+    GEMINI_AVAILABLE = importlib.util.find_spec('google.generativeai') is not None
 except ImportError:
     GEMINI_AVAILABLE = False
 
 
-def format_number(num):
-    """숫자를 읽기 쉬운 형식으로 변환"""
-    return f"{num:,}"
+# 분류형 작업이므로 경량 모델 사용 (응답 지연/비용 절감)
+GEMINI_MODEL_NAME = 'gemini-2.5-flash-lite'
 
+# 고정 지시문 (체크리스트 + 응답 형식) - 모델 생성 시 system_instruction으로 한 번만 전달
+SYSTEM_INSTRUCTION = """
+당신은 광고주를 위한 유튜브 채널 브랜드 세이프티 분석가입니다.
+사용자 메시지로 분석할 채널 정보가 JSON으로 주어집니다.
+- channel: 채널명, subs: 구독자 수, avg_views: 평균 조회수, eng: 평균 참여율(%)
+- videos: 최근 영상 목록 [{t: 제목, v: 조회수, l: 좋아요, c: 댓글}]
 
-def analyze_with_gemini(channel_name, subscriber_count, avg_views, engagement_rate, recent_videos, cost_data, gemini_api_loaded):
-    """
-    Gemini AI를 사용한 종합 브랜드 세이프티 분석
-
-    Parameters:
-    -----------
-    channel_name : str
-        채널명
-    subscriber_count : int
-        구독자 수
-    avg_views : int
-        평균 조회수
-    engagement_rate : float
-        참여율 (%)
-    recent_videos : list
-        최근 영상 목록
-    cost_data : dict
-        광고 비용 정보
-    gemini_api_loaded : bool
-        Gemini API 로드 여부
-
-    Returns:
-    --------
-    dict or None : AI 분석 결과 (JSON 형식)
-    """
-    if not GEMINI_AVAILABLE or not gemini_api_loaded:
-        return None
-
-    try:
-        # 영상 정보 요약
-        video_info = []
-        for i, video in enumerate(recent_videos[:5], 1):
-            title = video['snippet']['title']
-            views = int(video['statistics'].get('viewCount', 0))
-            likes = int(video['statistics'].get('likeCount', 0))
-            comments = int(video['statistics'].get('commentCount', 0))
-            video_info.append(f"{i}. 제목: {title[:50]}..., 조회수: {format_number(views)}, 좋아요: {format_number(likes)}, 댓글: {format_number(comments)}")
-
-        video_summary = "\n".join(video_info)
-
-        prompt = f"""
-다음 유튜브 채널을 브랜드 세이프티 체크리스트에 따라 분석해주세요.
-
-## 채널 정보
-- 채널명: {channel_name}
-- 구독자: {format_number(subscriber_count)}명
-- 평균 조회수: {format_number(avg_views)}회
-- 평균 참여율: {engagement_rate:.2f}%
-- 광고 견적: {format_number(cost_data['final_cost'])}원
-
-## 최근 5개 영상
-{video_summary}
+이 채널을 브랜드 세이프티 체크리스트에 따라 분석해주세요.
 
 ## 체크리스트
 
@@ -125,105 +86,231 @@ def analyze_with_gemini(channel_name, subscriber_count, avg_views, engagement_ra
 - **약점**: 있다면 나열
 
 반드시 다음 JSON 형식으로만 답변하세요:
-{{
-  "content_safety": {{
+{
+  "content_safety": {
     "score": 90,
     "sexual_content": 95,
     "violence": 95,
     "hate_speech": 95,
     "language": 85,
     "issues": ["경미한 욕설 1-2회 사용"]
-  }},
-  "legal_ethics": {{
+  },
+  "legal_ethics": {
     "score": 95,
     "copyright": 95,
     "misinformation": 95,
     "illegal_activity": 100,
     "ad_disclosure": 95,
     "issues": []
-  }},
-  "reputation": {{
+  },
+  "reputation": {
     "score": 85,
     "past_controversies": 90,
     "political_religious": 95,
     "subscriber_sentiment": 80,
     "issues": ["2년 전 경미한 논란 있었으나 해결"]
-  }},
-  "community": {{
+  },
+  "community": {
     "score": 90,
     "comment_management": 90,
     "subscriber_authenticity": 95,
     "influencer_associations": 90,
     "issues": []
-  }},
-  "brand_fit": {{
+  },
+  "brand_fit": {
     "score": 85,
     "value_alignment": 85,
     "competitor_history": 90,
     "ad_quality": 80,
     "issues": []
-  }},
-  "additional_checks": {{
+  },
+  "additional_checks": {
     "score": 90,
     "transparency": 85,
     "content_consistency": 95,
     "platform_compliance": 95,
     "issues": []
-  }},
+  },
   "overall_score": 89,
-  "risk_assessment": {{
+  "risk_assessment": {
     "level": "low",
     "red_flags": [],
     "concerns": ["일부 영상 조회수 편차"]
-  }},
-  "recommendation": {{
+  },
+  "recommendation": {
     "action": "proceed",
     "reason": "전반적으로 안전한 채널, 브랜드 이미지 손상 위험 낮음"
-  }},
-  "content_quality": {{
+  },
+  "content_quality": {
     "score": 85,
     "professionalism": "high",
     "consistency": "excellent"
-  }},
-  "ad_effect": {{
-    "views_prediction": {{
+  },
+  "ad_effect": {
+    "views_prediction": {
       "min": 60000,
       "avg": 80000,
       "max": 120000
-    }},
+    },
     "summary": "높은 참여율과 전문성을 바탕으로 광고 효과가 우수할 것으로 예상됩니다. 타겟 오디언스와의 부합도가 높아 긍정적인 브랜드 인지도 향상이 기대됩니다."
-  }},
-  "detailed_analysis": {{
+  },
+  "detailed_analysis": {
     "target_audience": "25-40세 IT 관심층",
     "strengths": ["전문적인 콘텐츠", "높은 참여율", "일관된 주제"],
     "weaknesses": ["조회수 편차"]
-  }},
-  "brand_safety": {{
+  },
+  "brand_safety": {
     "score": 89,
-    "checklist": {{
-      "inappropriate_content": {{"status": "pass", "detail": "부적절한 콘텐츠 없음"}},
-      "controversial_topics": {{"status": "pass", "detail": "논란 주제 없음"}},
-      "profanity": {{"status": "warning", "detail": "경미한 욕설 1-2회"}},
-      "brand_alignment": {{"status": "pass", "detail": "브랜드 이미지와 부합"}}
-    }}
-  }}
-}}
+    "checklist": {
+      "inappropriate_content": {"status": "pass", "detail": "부적절한 콘텐츠 없음"},
+      "controversial_topics": {"status": "pass", "detail": "논란 주제 없음"},
+      "profanity": {"status": "warning", "detail": "경미한 욕설 1-2회"},
+      "brand_alignment": {"status": "pass", "detail": "브랜드 이미지와 부합"}
+    }
+  }
+}
 """
 
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        response = model.generate_content(prompt)
+_model = None
+
+
+def get_genai():
+    """google.generativeai 모듈 반환 (첫 호출 시에만 실제 import, 이후는 sys.modules 캐시)"""
+    import google.generativeai as genai
+    return genai
+
+
+def _get_model():
+    """Gemini 모델 생성 (모듈 수준에서 1회 생성 후 재사용)"""
+    global _model
+    if _model is None:
+        _model = get_genai().GenerativeModel(GEMINI_MODEL_NAME, system_instruction=SYSTEM_INSTRUCTION)
+    return _model
+
+
+# AI 호출 생략 기준 (명백히 광고 부적합한 채널은 휴리스틱으로 즉시 판정)
+MIN_AVG_VIEWS = 500
+MIN_ENGAGEMENT_RATE = 0.3
+
+
+def heuristic_screen(avg_views, engagement_rate):
+    """명백한 부적격 사유 목록 반환 (해당 없으면 빈 리스트)"""
+    reasons = []
+    if avg_views < MIN_AVG_VIEWS:
+        reasons.append(f"평균 조회수 {MIN_AVG_VIEWS:,}회 미만")
+    if engagement_rate < MIN_ENGAGEMENT_RATE:
+        reasons.append(f"평균 참여율 {MIN_ENGAGEMENT_RATE}% 미만")
+    return reasons
+
+
+def _heuristic_result(reasons, avg_views):
+    """휴리스틱 판정 결과 (AI 응답과 같은 형식, heuristic 플래그 포함)
+
+    콘텐츠는 검사하지 않았으므로 brand_safety 항목은 넣지 않음
+    """
+    summary = "채널 지표(" + ", ".join(reasons) + ")가 기준에 미달하여 광고 효과를 기대하기 어렵습니다."
+    return {
+        "heuristic": True,
+        "overall_score": 20,
+        "risk_assessment": {
+            "level": "high",
+            "red_flags": [],
+            "concerns": reasons
+        },
+        "recommendation": {
+            "action": "caution",
+            "reason": "비추천 - " + summary
+        },
+        "content_quality": {
+            "score": 20,
+            "professionalism": "평가 생략",
+            "consistency": "평가 생략"
+        },
+        "ad_effect": {
+            "views_prediction": {
+                "min": int(avg_views * 0.5),
+                "avg": int(avg_views),
+                "max": int(avg_views * 1.2)
+            },
+            "summary": summary
+        },
+        "detailed_analysis": {
+            "target_audience": "N/A",
+            "strengths": [],
+            "weaknesses": reasons
+        }
+    }
+
+
+def analyze_with_gemini(channel_name, subscriber_count, avg_views, engagement_rate, recent_videos, gemini_api_loaded, video_titles=None):
+    """
+    Gemini AI를 사용한 종합 브랜드 세이프티 분석
+
+    Parameters:
+    -----------
+    channel_name : str
+        채널명
+    subscriber_count : int
+        구독자 수
+    avg_views : int
+        평균 조회수
+    engagement_rate : float
+        참여율 (%)
+    recent_videos : list
+        최근 영상 목록
+    gemini_api_loaded : bool
+        Gemini API 로드 여부
+    video_titles : list, optional
+        호출부에서 미리 잘라 둔 영상 제목 목록 (없으면 recent_videos에서 추출)
+
+    Returns:
+    --------
+    dict or None : AI 분석 결과 (JSON 형식)
+    """
+    if not GEMINI_AVAILABLE or not gemini_api_loaded:
+        return None
+
+    # 명백한 부적격 채널은 AI 호출 없이 즉시 판정 (지연/비용 절감)
+    reasons = heuristic_screen(avg_views, engagement_rate)
+    if reasons:
+        return _heuristic_result(reasons, avg_views)
+
+    try:
+        if video_titles is None:
+            video_titles = [video['snippet']['title'][:60] for video in recent_videos[:5]]
+
+        # 채널/영상 정보를 간결한 JSON으로 전달 (입력 토큰 절감)
+        payload = {
+            "channel": channel_name,
+            "subs": subscriber_count,
+            "avg_views": avg_views,
+            "eng": round(engagement_rate, 2),
+            "videos": [
+                {
+                    "t": title,
+                    "v": int(video['statistics'].get('viewCount', 0)),
+                    "l": int(video['statistics'].get('likeCount', 0)),
+                    "c": int(video['statistics'].get('commentCount', 0)),
+                }
+                for title, video in zip(video_titles, recent_videos[:5])
+            ],
+        }
+        prompt = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+
+        model = _get_model()
+        response = model.generate_content(
+            prompt,
+            # JSON 모드: 코드 블록 없이 순수 JSON만 응답하도록 강제
+            generation_config=get_genai().GenerationConfig(
+                response_mime_type='application/json',
+                temperature=0.2
+            ),
+            # 응답 지연 상한 (초)
+            request_options={'timeout': 20}
+        )
 
         # JSON 파싱
-        response_text = response.text.strip()
-        # JSON 코드 블록 제거
-        if response_text.startswith('```json'):
-            response_text = response_text[7:]
-        if response_text.startswith('```'):
-            response_text = response_text[3:]
-        if response_text.endswith('```'):
-            response_text = response_text[:-3]
-
-        result = json.loads(response_text.strip())
+        result = json_loads(response.text)
         return result
 
     except Exception as e:
@@ -7,21 +7,33 @@
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
 import cost_calculator
 import pandas as pd
+import numpy as np
+from PIL import Image
 import json
+import hashlib
 import brand_safety_analyzer
 
-# Gemini AI (선택적 import)
+# Gemini AI (설치 여부만 확인, 실제 import는 AI 분석 실행 시점까지 지연)
+GEMINI_AVAILABLE = brand_safety_analyzer.GEMINI_AVAILABLE
+
+# orjson (선택적 import, 없으면 표준 json 사용)
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    import orjson
+    json_loads = orjson.loads
 except ImportError:
-    GEMINI_AVAILABLE = False
+    json_loads = json.loads
 
 # 페이지 설정
 st.set_page_config(
@@ -31,7 +43,7 @@ st.set_page_config(
 )
 
 # --- 스타일 ---
-st.markdown("""
+_STYLE_BLOCK = """
 <style>
 /* 강조 박스 */
 .info-box {
@@ -78,7 +90,6 @@ st.markdown("""
     background-color: rgba(76, 175, 80, 0.2);
 }
 
-[data-theme="dark"] .cost-label,
 [data-theme="dark"] small,
 [data-theme="dark"] .caption {
     color: #e0e0e0 !important;
@@ -107,7 +118,7 @@ st.markdown("""
         background-color: rgba(76, 175, 80, 0.2);
     }
 
-    .cost-label, small, .caption {
+    small, .caption {
         color: #e0e0e0 !important;
     }
 }
@@ -121,29 +132,6 @@ st.markdown("""
     background-color: rgba(156, 39, 176, 0.05);
 }
 
-/* 비용 표시 카드 */
-.cost-card {
-    padding: 20px;
-    border-radius: 12px;
-    text-align: center;
-    margin: 10px 0;
-    border: 2px solid rgba(25, 118, 210, 0.5);
-    background-color: rgba(25, 118, 210, 0.05);
-}
-
-.cost-value {
-    font-size: 2em;
-    font-weight: bold;
-    color: #1976d2;
-    margin: 10px 0;
-}
-
-.cost-label {
-    font-size: 1.1em;
-    opacity: 0.8;
-    margin: 5px 0;
-}
-
 /* 프로그레스 애니메이션 */
 @keyframes pulse {
     0%, 100% { opacity: 1; }
@@ -311,202 +299,708 @@ st.markdown("""
     align-items: center;
     gap: 5px;
 }
+/* 브랜드 안전성 카드 (점수 구간별 색상은 tier-* 클래스의 CSS 변수로 지정) */
+.tier-excellent { --tier-color: #4caf50; --tier-bg: #e8f5e9; }
+.tier-good { --tier-color: #8bc34a; --tier-bg: #f1f8e9; }
+.tier-caution { --tier-color: #ff9800; --tier-bg: #fff3e0; }
+.tier-danger { --tier-color: #f44336; --tier-bg: #ffebee; }
+
+.tier-text {
+    color: var(--tier-color);
+}
+
+.safety-card {
+    background: linear-gradient(135deg, var(--tier-bg) 0%, #ffffff 100%);
+    padding: 30px;
+    border-radius: 15px;
+    border: 3px solid var(--tier-color);
+    margin: 20px 0;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+}
+
+.safety-badge {
+    background-color: var(--tier-color);
+    color: white;
+    padding: 15px 25px;
+    border-radius: 10px;
+    font-size: 1.5em;
+    font-weight: bold;
+    text-align: center;
+    margin-bottom: 20px;
+}
+
+.safety-category-card {
+    background-color: var(--tier-bg);
+    padding: 15px;
+    border-radius: 10px;
+    border-left: 4px solid var(--tier-color);
+    margin-bottom: 15px;
+    height: 100%;
+}
+.safety-grid {
+    display: grid;
+    grid-template-columns: repeat(3, minmax(0, 1fr));
+    column-gap: 1rem;
+}
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# --- 제목 ---
-st.title("🎬 유튜브 인플루언서 검색 엔진 v4.3")
-st.caption("Smart Tier System 🔥 | AI Brand Safety Analysis ✅")
-st.caption("🤖 AI 기반 광고 효과 예측 기능 탑재")
+def _minify_css(css):
+    """CSS 주석과 불필요한 공백 제거 (웹소켓 전송량 절감)"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    return css.strip()
+
+@st.cache_resource
+def _inject_style():
+    """전역 스타일 주입 (세션당 1회 압축 후 생성, 재실행 시 캐시에서 재생)"""
+    st.markdown(_minify_css(_STYLE_BLOCK), unsafe_allow_html=True)
 
 # --- API 키 로드 ---
-# YouTube API
-try:
-    youtube_api_key = st.secrets["YOUTUBE_API_KEY"]
-    youtube_api_loaded = True
-except:
+@st.cache_resource
+def load_api_keys():
+    """API 키 로드 (st.secrets 우선, 없으면 환경변수) - 프로세스당 1회"""
+    names = ("YOUTUBE_API_KEY", "GEMINI_API_KEY")
     try:
-        youtube_api_key = os.environ.get("YOUTUBE_API_KEY")
-        youtube_api_loaded = bool(youtube_api_key)
-    except:
-        youtube_api_key = None
-        youtube_api_loaded = False
+        secrets = {name: st.secrets.get(name) for name in names}
+    except FileNotFoundError:
+        # secrets.toml 자체가 없는 환경 (환경변수만 사용)
+        secrets = {}
+    return {name: secrets.get(name) or os.environ.get(name) for name in names}
+
+api_keys = load_api_keys()
+
+# YouTube API
+youtube_api_key = api_keys["YOUTUBE_API_KEY"]
+youtube_api_loaded = bool(youtube_api_key)
 
 # Gemini API
-try:
-    gemini_api_key = st.secrets["GEMINI_API_KEY"]
-    gemini_api_loaded = True
-except:
-    try:
-        gemini_api_key = os.environ.get("GEMINI_API_KEY")
-        gemini_api_loaded = bool(gemini_api_key)
-    except:
-        gemini_api_key = None
-        gemini_api_loaded = False
+gemini_api_key = api_keys["GEMINI_API_KEY"]
+gemini_api_loaded = bool(gemini_api_key)
 
-if not youtube_api_loaded:
-    st.error("⚠️ YouTube API 키가 설정되지 않았습니다.")
+@st.cache_resource
+def _configure_gemini(api_key):
+    """Gemini 클라이언트 설정 (프로세스당 1회, 재실행 시 생략)"""
+    brand_safety_analyzer.get_genai().configure(api_key=api_key)
 
-if GEMINI_AVAILABLE and gemini_api_loaded:
-    genai.configure(api_key=gemini_api_key)
-    st.success("✅ AI 분석 기능 활성화됨 (Gemini)")
-elif not GEMINI_AVAILABLE:
-    st.warning("⚠️ Gemini AI 패키지가 설치되지 않았습니다. `pip install google-generativeai`")
+# 키가 없으면 스타일/제목 없이 최소 오류 화면만 표시
+if youtube_api_loaded and youtube_api_key:
+    _inject_style()
+
+    # --- 제목 ---
+    st.title("🎬 유튜브 인플루언서 검색 엔진 v4.3")
+    st.caption("Smart Tier System 🔥 | AI Brand Safety Analysis ✅")
+    st.caption("🤖 AI 기반 광고 효과 예측 기능 탑재")
+
+    if GEMINI_AVAILABLE and gemini_api_loaded:
+        st.success("✅ AI 분석 기능 활성화됨 (Gemini)")
+    elif not GEMINI_AVAILABLE:
+        st.warning("⚠️ Gemini AI 패키지가 설치되지 않았습니다. `pip install google-generativeai`")
+    else:
+        st.info("💡 Gemini API 키를 설정하면 AI 분석 기능을 사용할 수 있습니다.")
 else:
-    st.info("💡 Gemini API 키를 설정하면 AI 분석 기능을 사용할 수 있습니다.")
+    st.error("⚠️ YouTube API 키가 설정되지 않았습니다.")
 
 # --- 함수 정의 ---
 
+# YouTube Data API 엔드포인트
+_YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
+_CHANNELS_URL = f"{_YOUTUBE_API_BASE}/channels"
+_PLAYLIST_ITEMS_URL = f"{_YOUTUBE_API_BASE}/playlistItems"
+_VIDEOS_URL = f"{_YOUTUBE_API_BASE}/videos"
+
+# 채널 조회 시 실제 사용하는 필드만 요청 (부분 응답으로 전송량 절감)
+_CHANNEL_FIELDS = (
+    'items(id,snippet(title,thumbnails/medium/url),'
+    'statistics(subscriberCount,videoCount,viewCount),contentDetails/relatedPlaylists/uploads)'
+)
+
+@st.cache_resource
+def get_http_session():
+    """HTTP 세션 (프로세스당 1회 생성, keep-alive로 TCP/TLS 연결 재사용, 일시적 오류는 짧은 백오프로 재시도)"""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        # 재시도 후에도 오류 상태면 예외 대신 마지막 응답을 그대로 반환 (오류 응답은 items 없음으로 처리됨)
+        # 읽기 타임아웃은 재시도하지 않음 (느린 응답을 최대 4번 기다리지 않고 바로 조회 실패로 처리)
+        max_retries=Retry(total=3, read=0, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+    ))
+    return session
+
+# API 요청 타임아웃 (연결, 읽기) 초 - 응답 없는 연결이 작업 스레드를 붙잡지 않도록
+_HTTP_TIMEOUT = (3.0, 10.0)
+
+# 영상 URL 패턴 (미리 컴파일)
+_VIDEO_URL_RES = [
+    re.compile(r'youtube\.com/watch\?v=([a-zA-Z0-9_-]+)'),
+    re.compile(r'youtu\.be/([a-zA-Z0-9_-]+)'),
+    re.compile(r'm\.youtube\.com/watch\?v=([a-zA-Z0-9_-]+)'),
+]
+
+@st.cache_resource(max_entries=256, show_spinner=False)  # 프로세스 내 LRU (재실행 간 유지)
 def extract_video_id(url):
     """유튜브 URL에서 영상 ID를 추출하는 함수"""
-    video_patterns = [
-        r'youtube\.com/watch\?v=([a-zA-Z0-9_-]+)',
-        r'youtu\.be/([a-zA-Z0-9_-]+)',
-        r'm\.youtube\.com/watch\?v=([a-zA-Z0-9_-]+)',
-    ]
-
-    for pattern in video_patterns:
-        match = re.search(pattern, url)
+    for regex in _VIDEO_URL_RES:
+        match = regex.search(url)
         if match:
             return match.group(1)
 
     return None
 
+# 채널 URL 패턴 (채널 ID / 핸들 / 커스텀 URL / 사용자명을 한 번의 검색으로 판별)
+_CHANNEL_URL_RE = re.compile(
+    r'youtube\.com/(?:channel/(?P<channel>[a-zA-Z0-9_-]+)'
+    r'|@(?P<handle>[^/?&]+)'
+    r'|c/(?P<custom>[^/?&]+)'
+    r'|user/(?P<user>[^/?&]+))'
+)
+
+@st.cache_resource(max_entries=256, show_spinner=False)  # 프로세스 내 LRU (재실행 간 유지)
 def extract_channel_id(url):
-    """유튜브 URL에서 채널 ID를 추출하는 함수"""
-    channel_id_pattern = r'youtube\.com/channel/([a-zA-Z0-9_-]+)'
-    unicode_patterns = [
-        r'youtube\.com/@([^/?&]+)',
-        r'youtube\.com/c/([^/?&]+)',
-        r'youtube\.com/user/([^/?&]+)',
-    ]
-
-    match = re.search(channel_id_pattern, url)
-    if match:
-        return match.group(1), channel_id_pattern
-
-    for pattern in unicode_patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1), pattern
+    """유튜브 URL에서 채널 ID를 추출하는 함수
 
-    return None, None
+    반환값: (식별자, 종류) - 종류는 'channel', 'handle', 'custom', 'user' 중 하나
+    """
+    match = _CHANNEL_URL_RE.search(url)
+    if not match:
+        return None, None
 
-@st.cache_data(ttl=600)  # 10분간 캐시
-def get_channel_id_from_video(video_id, api_key):
-    """영상 ID로 채널 ID를 가져오는 함수"""
-    url = "https://www.googleapis.com/youtube/v3/videos"
-    params = {
-        'part': 'snippet',
-        'id': video_id,
-        'key': api_key
-    }
+    kind = match.lastgroup
+    return match.group(kind), kind
 
-    response = requests.get(url, params=params)
-    data = response.json()
+class YouTubeAPIError(Exception):
+    """YouTube Data API 조회 실패 (st.cache_data는 예외를 캐시하지 않으므로 실패한 조회는 다음 재실행에서 다시 시도됨)"""
 
-    if 'items' in data and len(data['items']) > 0:
-        return data['items'][0]['snippet']['channelId']
-    return None
+def _get_first_item(url, params, api_key):
+    """YouTube Data API 단건 조회 공통 처리 (첫 번째 item 반환, 오류 응답이거나 item이 없으면 YouTubeAPIError)"""
+    params = {**params, 'prettyPrint': 'false', 'key': api_key}
 
-@st.cache_data(ttl=600)  # 10분간 캐시
-def get_channel_info_by_id(channel_id, api_key):
-    """채널 ID로 채널 정보를 가져오는 함수"""
-    url = "https://www.googleapis.com/youtube/v3/channels"
-    params = {
-        'part': 'snippet,statistics,contentDetails',
-        'id': channel_id,
-        'key': api_key
-    }
-
-    response = requests.get(url, params=params)
-    data = response.json()
+    try:
+        response = get_http_session().get(url, params=params, timeout=_HTTP_TIMEOUT)
+    except requests.RequestException as e:  # 타임아웃/연결 오류 포함
+        raise YouTubeAPIError(str(e)) from e
+    data = json_loads(response.content)
+
+    items = data.get('items')
+    if not items:
+        # 할당량 초과/권한 오류 등 오류 응답과 조회 결과 없음 모두 캐시하지 않음
+        raise YouTubeAPIError(data.get('error', {}).get('message', 'no items'))
+    return items[0]
+
+def _fetch_or_none(fetch, *args):
+    """캐시된 조회 함수 호출 (조회 실패는 None으로 변환, 실패 결과는 캐시에 남지 않음)"""
+    try:
+        return fetch(*args)
+    except YouTubeAPIError:
+        return None
 
-    if 'items' in data and len(data['items']) > 0:
-        return data['items'][0]
-    return None
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)  # 1시간 캐시 (성공한 조회만, API 키는 캐시 키에서 제외)
+def get_channel_id_from_video(video_id, _api_key):
+    """영상 ID로 채널 ID를 가져오는 함수"""
+    item = _get_first_item(_VIDEOS_URL, {'part': 'snippet', 'id': video_id, 'fields': 'items(snippet/channelId)'}, _api_key)
+    return item['snippet']['channelId']
 
-@st.cache_data(ttl=600)  # 10분간 캐시
-def get_channel_info_by_username(username, api_key):
-    """사용자 이름으로 채널 정보를 가져오는 함수"""
-    url = "https://www.googleapis.com/youtube/v3/channels"
-    params = {
-        'part': 'snippet,statistics,contentDetails',
-        'forHandle': username,
-        'key': api_key
-    }
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)  # 1시간 캐시 (성공한 조회만, API 키는 캐시 키에서 제외)
+def get_channel_info_by_id(channel_id, _api_key):
+    """채널 ID로 채널 정보를 가져오는 함수"""
+    return _get_first_item(_CHANNELS_URL, {'part': 'snippet,statistics,contentDetails', 'id': channel_id, 'fields': _CHANNEL_FIELDS}, _api_key)
 
-    response = requests.get(url, params=params)
-    data = response.json()
+@st.cache_data(ttl=86400, max_entries=256, show_spinner=False)  # 24시간 캐시 (핸들은 거의 바뀌지 않음, 성공한 조회만, API 키는 캐시 키에서 제외)
+def resolve_handle_to_channel_id(handle, _api_key):
+    """핸들(@...)로 채널 ID만 조회하는 함수"""
+    item = _get_first_item(_CHANNELS_URL, {'part': 'id', 'forHandle': handle, 'fields': 'items(id)'}, _api_key)
+    return item['id']
 
-    if 'items' in data and len(data['items']) > 0:
-        return data['items'][0]
-    return None
-
-@st.cache_data(ttl=600)  # 10분간 캐시
-def get_recent_videos(uploads_playlist_id, api_key, max_results=10):
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)  # 1시간 캐시 (성공한 조회만, API 키는 캐시 키에서 제외)
+def get_recent_videos(uploads_playlist_id, _api_key, max_results=10):
     """최근 업로드된 비디오 정보를 가져오는 함수"""
-    url = "https://www.googleapis.com/youtube/v3/playlistItems"
+    url = _PLAYLIST_ITEMS_URL
     params = {
         'part': 'contentDetails',
         'playlistId': uploads_playlist_id,
         'maxResults': max_results,
-        'key': api_key
+        'fields': 'items(contentDetails/videoId)',
+        'prettyPrint': 'false',
+        'key': _api_key
     }
 
-    response = requests.get(url, params=params)
-    data = response.json()
+    try:
+        response = get_http_session().get(url, params=params, timeout=_HTTP_TIMEOUT)
+    except requests.RequestException as e:  # 타임아웃/연결 오류 포함
+        raise YouTubeAPIError(str(e)) from e
+    data = json_loads(response.content)
 
     if 'items' not in data:
-        return []
+        raise YouTubeAPIError(data.get('error', {}).get('message', 'no items'))
 
     video_ids = [item['contentDetails']['videoId'] for item in data['items']]
 
-    videos_url = "https://www.googleapis.com/youtube/v3/videos"
+    videos_url = _VIDEOS_URL
     videos_params = {
         'part': 'statistics,snippet',
         'id': ','.join(video_ids),
-        'key': api_key
+        'fields': 'items(id,snippet/title,statistics(viewCount,likeCount,commentCount))',
+        'prettyPrint': 'false',
+        'key': _api_key
     }
 
-    videos_response = requests.get(videos_url, params=videos_params)
-    videos_data = videos_response.json()
+    try:
+        videos_response = get_http_session().get(videos_url, params=videos_params, timeout=_HTTP_TIMEOUT)
+    except requests.RequestException as e:
+        raise YouTubeAPIError(str(e)) from e
+    videos_data = json_loads(videos_response.content)
 
+    if 'error' in videos_data:
+        raise YouTubeAPIError(videos_data['error'].get('message', 'error'))
     return videos_data.get('items', [])
 
-def calculate_engagement_rate(video_stats):
-    """참여율 계산"""
-    views = int(video_stats.get('viewCount', 0))
-    likes = int(video_stats.get('likeCount', 0))
-    comments = int(video_stats.get('commentCount', 0))
+class AIAnalysisError(Exception):
+    """Gemini 분석 실패 (st.cache_data는 예외를 캐시하지 않으므로 실패한 호출만 다음에 재시도됨)"""
+
+@st.cache_data(ttl=86400, max_entries=256, show_spinner=False)  # 24시간 캐시 (같은 채널·같은 영상 목록이면 Gemini 재호출 방지)
+def run_ai_analysis(channel_id, video_ids, gemini_api_loaded, _channel_name, _subscriber_count, _avg_views, _engagement_rate, _recent_videos, _video_titles=None):
+    """AI 브랜드 세이프티 분석 (채널 ID + 최근 영상 ID 목록 기준으로 캐시, 시시각각 변하는 지표는 캐시 키에서 제외)"""
+    result = brand_safety_analyzer.analyze_with_gemini(
+        _channel_name,
+        _subscriber_count,
+        _avg_views,
+        _engagement_rate,
+        _recent_videos,
+        gemini_api_loaded,
+        video_titles=_video_titles
+    )
+    if result and "error" in result:
+        raise AIAnalysisError(result['error'])
+    return result
+
+@st.cache_data(ttl=86400, max_entries=256, show_spinner=False)  # 24시간 캐시 (실패는 예외로 전달되어 캐시되지 않음)
+def _download_thumbnail(url):
+    """채널 썸네일 이미지를 내려받아 바이트로 반환 (실제로 디코딩되는 이미지만, 아니면 ValueError)"""
+    response = get_http_session().get(url, timeout=_HTTP_TIMEOUT)
+    response.raise_for_status()
+
+    if not response.headers.get('Content-Type', '').startswith('image/'):
+        raise ValueError("not an image")
+
+    # 잘린 응답이나 지원하지 않는 형식은 st.image에서 실패하므로 여기서 한 번 디코딩해 확인
+    try:
+        with Image.open(io.BytesIO(response.content)) as image:
+            image.load()
+    except (OSError, SyntaxError) as e:
+        raise ValueError("undecodable image") from e
+    return response.content
+
+def fetch_thumbnail(url):
+    """채널 썸네일 이미지 바이트 반환 (실패 시 URL 그대로 반환해 브라우저가 직접 불러오도록 함)"""
+    try:
+        return _download_thumbnail(url)
+    except (requests.RequestException, ValueError):
+        return url
+
+@st.cache_resource
+def _get_executor():
+    """API 병렬 호출용 스레드 풀 (프로세스 전체에서 공유)"""
+    return ThreadPoolExecutor(max_workers=4)
+
+@st.cache_resource
+def _get_ai_executor():
+    """AI 분석 전용 스레드 풀 (최대 20초 걸리는 Gemini 호출이 API 조회를 막지 않도록 분리)"""
+    return ThreadPoolExecutor(max_workers=4)
+
+def submit_with_ctx(fn, *args, executor=None):
+    """현재 스크립트 컨텍스트를 작업 스레드에 전달하여 제출 (st.cache_data 동작에 필요)"""
+    ctx = get_script_run_ctx()
+
+    def task():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args)
+
+    return (executor or _get_executor()).submit(task)
+
+def fetch_channel_and_videos(channel_id, api_key, max_results=10):
+    """채널 정보를 가져오고, 최근 영상 조회는 백그라운드로 미리 시작하는 함수
+
+    업로드 재생목록 ID는 채널 ID(UC...)에서 바로 유도(UU...)되므로
+    채널 조회를 기다리지 않고 영상 조회를 먼저 제출한다.
+    반환값: (channel_info, 최근 영상 Future) - 조회 실패 시 각각 None
+    """
+    uploads_playlist_id = 'UU' + channel_id[2:]
+    videos_future = submit_with_ctx(_fetch_or_none, get_recent_videos, uploads_playlist_id, api_key, max_results)
+    channel_info = _fetch_or_none(get_channel_info_by_id, channel_id, api_key)
+
+    # 유도한 ID가 실제 재생목록과 다르면 실제 값으로 다시 조회
+    if channel_info:
+        actual_playlist_id = channel_info['contentDetails']['relatedPlaylists']['uploads']
+        if actual_playlist_id != uploads_playlist_id:
+            videos_future = submit_with_ctx(_fetch_or_none, get_recent_videos, actual_playlist_id, api_key, max_results)
+
+    return channel_info, videos_future
+
+# 영상 통계 필드 순서 (배열 열 순서: 조회수, 좋아요, 댓글)
+_VIDEO_STAT_KEYS = ('viewCount', 'likeCount', 'commentCount')
+
+def get_video_stats_array(videos):
+    """영상별 (조회수, 좋아요, 댓글)을 (N, 3) 정수 배열로 한 번에 추출"""
+    return np.fromiter(
+        (int(video['statistics'].get(key, 0)) for video in videos for key in _VIDEO_STAT_KEYS),
+        dtype=np.int64,
+        count=len(videos) * len(_VIDEO_STAT_KEYS)
+    ).reshape(-1, len(_VIDEO_STAT_KEYS))
+
+def calculate_engagement_rates(stats_array):
+    """영상별 참여율 계산 (조회수 0인 영상은 0)"""
+    views = stats_array[:, 0]
+    interactions = stats_array[:, 1] + stats_array[:, 2]
+    rates = np.divide(interactions * 100.0, views, out=np.zeros(len(views)), where=views > 0)
+    return np.round(rates, 2)
+
+def calculate_average_stats(stats_array):
+    """평균 조회수, 좋아요, 댓글 계산"""
+    if len(stats_array) == 0:
+        return 0, 0, 0
+
+    avg_views, avg_likes, avg_comments = (stats_array.sum(axis=0) // len(stats_array)).tolist()
+    return avg_views, avg_likes, avg_comments
+
+# 숫자를 읽기 쉬운 형식으로 변환 (천 단위 콤마)
+format_number = "{:,}".format
+
+# 프리미엄 요소 카드 템플릿 (4개 카드가 같은 틀을 공유하고 값만 format_map으로 채움)
+_PREMIUM_CARD_TMPL = """
+<div style="background: {bg}; padding: 15px; border-radius: 8px; border-left: 4px solid {border}; margin-bottom: 10px;">
+    <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 5px;">
+        <div style="font-size: 1.1em; font-weight: bold;">
+            {title}
+        </div>
+        <div class="tooltip-container">
+            <div class="tooltip-icon">?</div>
+            <div class="tooltip-text" style="width: 340px;">
+{tooltip}
+            </div>
+        </div>
+    </div>
+    <div style="color: #555; margin-bottom: 5px;">
+        {label}: <strong>{value}</strong> (×{multiplier})
+    </div>
+    <div style="font-size: 0.85em; color: #666;">
+        {description}
+    </div>
+</div>
+"""
 
-    if views == 0:
-        return 0
+# 프리미엄 요소별 툴팁 설명
+_PREMIUM_TOOLTIPS = {
+    'health': """<strong>채널 건강도란?</strong><br>
+평균 조회수가 구독자 수 대비 얼마나 되는지 측정합니다.<br><br>
+<span class="benchmark">✓ 등급:</span><br>
+• 초건강 (30%+): ×1.20<br>
+• 매우 건강 (20-30%): ×1.15<br>
+• 건강 (15-20%): ×1.10<br>
+• 정상 (10-15%): ×1.00<br>
+• 약화 (5-10%): ×0.70~0.85<br>
+• 죽어감 (5% 미만): ×0.30~0.50<br><br>
+건강할수록 광고 비용이 올라갑니다!""",
+    'consistency': """<strong>업로드 일관성이란?</strong><br>
+채널이 얼마나 꾸준히 영상을 올리는지 측정합니다.<br><br>
+<div class="formula">영상 수 ÷ 채널 개설 일수</div><br>
+<span class="benchmark">✓ 등급:</span><br>
+• <strong>매우 규칙적:</strong> 주 7회 이상 (×1.08)<br>
+• <strong>규칙적:</strong> 주 3-7회 (×1.05)<br>
+• <strong>보통:</strong> 주 1-3회 (×1.00)<br>
+• <strong>불규칙:</strong> 월 1-4회 (×0.97)<br>
+• <strong>비활성:</strong> 월 1회 미만 (×0.90)<br><br>
+규칙적인 채널은 구독자 이탈이 적고, 광고 효과가 오래 지속됩니다!""",
+    'growth': """<strong>성장세란?</strong><br>
+최근 90일 조회수를 전체 평균과 비교하여 채널이 성장 중인지 판단합니다.<br><br>
+<div class="formula">최근 90일 평균 ÷ 전체 평균 × 100</div><br>
+<span class="benchmark">✓ 등급:</span><br>
+• <strong>급성장:</strong> 최근이 50% 이상 높음 (×1.15)<br>
+• <strong>성장:</strong> 최근이 20-50% 높음 (×1.10)<br>
+• <strong>약성장:</strong> 최근이 5-20% 높음 (×1.05)<br>
+• <strong>안정:</strong> ±5% 이내 (×1.00)<br>
+• <strong>하락:</strong> 최근이 5-20% 낮음 (×0.95)<br>
+• <strong>급락:</strong> 최근이 20% 이상 낮음 (×0.85)<br><br>
+성장 중인 채널은 미래 가치가 높아 프리미엄이 붙습니다!""",
+    'loyalty': """<strong>팬덤 충성도란?</strong><br>
+댓글 비율을 통해 팬층이 얼마나 충성스러운지 측정합니다.<br><br>
+<div class="formula">(댓글 수 ÷ 조회수) × 100</div><br>
+<span class="benchmark">✓ 등급:</span><br>
+• <strong>최상:</strong> 0.5% 이상 (×1.10)<br>
+&nbsp;&nbsp;→ 조회수 1만당 댓글 50개 이상<br>
+• <strong>우수:</strong> 0.3-0.5% (×1.05)<br>
+&nbsp;&nbsp;→ 조회수 1만당 댓글 30-50개<br>
+• <strong>양호:</strong> 0.1-0.3% (×1.00)<br>
+&nbsp;&nbsp;→ 조회수 1만당 댓글 10-30개<br>
+• <strong>낮음:</strong> 0.1% 미만 (×0.97)<br>
+&nbsp;&nbsp;→ 조회수 1만당 댓글 10개 미만<br><br>
+댓글이 많은 채널은 진성 팬이 많아 광고 효과가 높습니다!""",
+}
 
-    engagement_rate = ((likes + comments) / views) * 100
-    return round(engagement_rate, 2)
+# 참고사항 (고정 문구, 한 번의 markdown 요소로 출력)
+_NOTES_MD = """
+**비용 산정 기준**
 
-def calculate_average_views(videos):
-    """평균 조회수 계산"""
-    if not videos:
-        return 0
+• 브랜디드 PPL 기준 (제품 1개당 30초~1분 내외 단순 노출)
 
-    total_views = sum(int(video['statistics'].get('viewCount', 0)) for video in videos)
-    return total_views // len(videos)
+• 단순 언급(Mention)은 30-50% 저렴
 
-def calculate_average_stats(videos):
-    """평균 좋아요, 댓글 계산"""
-    if not videos:
-        return 0, 0
+• 콘텐츠 재사용권 포함 시 20-50% 추가
 
-    total_likes = sum(int(video['statistics'].get('likeCount', 0)) for video in videos)
-    total_comments = sum(int(video['statistics'].get('commentCount', 0)) for video in videos)
+• 독점 계약 시 30-100% 추가 가능
 
-    return total_likes // len(videos), total_comments // len(videos)
+&nbsp;
 
-def format_number(num):
-    """숫자를 읽기 쉬운 형식으로 변환"""
-    return f"{num:,}"
+**v4.3 개선사항 (2025-11)**
+
+• 스마트 티어 시스템 도입 (채널 건강도 평가)
+
+• 조회수/구독자 비율 기반 8단계 건강도 측정
+
+• 건강도에 따른 가격 조정 (0.3x ~ 1.2x)
+
+• 구독자 뻥튀기 문제 해결
+
+&nbsp;
+
+**v4.2 개선사항 (2025-11)**
+
+• 티어별 최소 보장 금액 합리화 (Mega 4,750만→1,500만)
+
+• CPM 우선 작동, 티어는 보조 역할로 조정
+
+• 브랜드 세이프티 6개 카테고리 체크리스트
+
+&nbsp;
+
+**v4.1 개선사항**
+
+• CPM 기준 30,000원으로 조정 (시장 반영)
+
+• 최근 90일 CPM 계산 (죽은 채널 방지)
+
+• 참여 질 보정: 댓글/좋아요 비율 분석
+"""
+
+# 참여 질 설명 (고정 문구)
+_ENGAGEMENT_QUALITY_HELP_MD = """
+### 📊 댓글/좋아요 비율이란?
+
+**진짜 팬 vs 이벤트 참여자를 구분하는 지표입니다.**
+
+**비율 기준:**
+- ✅ **15% 이상**: 대화형 커뮤니티 (우수)
+  - 시청자들이 적극적으로 댓글을 남기고 소통합니다
+  - 좋아요 100개당 댓글 15개 이상
+  - 진정한 팬층이 형성된 채널
+
+- ✓ **5-15%**: 정상 범위
+  - 일반적인 수준의 참여도
+  - 좋아요 100개당 댓글 5-15개
+  - 평균적인 채널
+
+- ⚠️ **5% 미만**: 이벤트형 (저품질)
+  - 좋아요 100개당 댓글 5개 미만
+  - "좋아요 누르면 경품 추첨" 같은 이벤트로 유입된 참여자
+  - 실제 콘텐츠에 관심이 없는 시청자 다수
+
+**왜 중요한가요?**
+
+**이벤트형 채널의 문제점:**
+1. **낮은 광고 효과**: "좋아요만 누르고 가는" 시청자는 광고를 제대로 보지 않습니다
+2. **허수 참여**: 경품 때문에 온 사람들은 브랜드에 관심이 없습니다
+3. **전환율 낮음**: 실제 구매로 이어질 가능성이 매우 낮습니다
+
+**대화형 커뮤니티의 장점:**
+1. **진성 팬층**: 댓글을 남기는 사람은 콘텐츠를 진지하게 시청합니다
+2. **높은 신뢰도**: 인플루언서와 팬의 관계가 돈독합니다
+3. **광고 효과 극대화**: 추천을 신뢰하고 실제 구매로 이어집니다
+
+**광고주 입장에서:**
+- 댓글이 많은 채널 = 진짜 영향력이 있는 채널
+- 좋아요만 많은 채널 = 이벤트로 부풀려진 허수일 가능성
+"""
+
+# 채널 건강도 설명 (고정 문구)
+_HEALTH_HELP_MD = """
+### 📊 조회수/구독자 비율이란?
+
+**건강한 채널의 지표:**
+- 구독자 수만 많은 게 아니라, 실제로 시청하는 구독자가 많은 채널
+- 조회수가 구독자 수에 비례하는 활발한 채널
+
+**비율 기준:**
+- 🔥 **30% 이상**: 초건강 (10만 구독자 → 3만+ 조회수)
+- ✅ **20-30%**: 매우 건강 (10만 구독자 → 2-3만 조회수)
+- ✅ **15-20%**: 건강 (10만 구독자 → 1.5-2만 조회수)
+- ⚖️ **10-15%**: 정상 (10만 구독자 → 1-1.5만 조회수)
+- ⚠️ **7-10%**: 약간 약화 (10만 구독자 → 7천-1만 조회수)
+- ⚠️ **5-7%**: 약화 (10만 구독자 → 5천-7천 조회수)
+- 🟡 **3-5%**: 죽어감 (10만 구독자 → 3천-5천 조회수)
+- 🔴 **3% 미만**: 죽음 (구독자만 많고 조회수 없음)
+
+**왜 중요한가요?**
+- 구독자 수는 "과거의 영광"일 수 있습니다
+- 실제 광고 효과는 "현재 조회수"로 결정됩니다
+- 건강도가 낮으면 광고 집행 효과가 떨어집니다
+
+**티어 조정 계수:**
+- 건강도가 낮은 채널은 광고 비용이 하향 조정됩니다
+- 반대로 매우 건강한 채널은 프리미엄이 붙습니다
+- 공정한 가격 책정을 위한 시스템입니다
+"""
+
+# 브랜드 안전성 점수 구간별 표시 스타일 (높은 기준부터, 마지막 항목은 그 외 전부 / 색상은 css 클래스에 정의)
+_SAFETY_TIERS = (
+    (90, {'css': 'tier-excellent', 'status': '매우 안전', 'emoji': '🟢', 'badge': '✅ 광고 집행 적극 권장'}),
+    (80, {'css': 'tier-good', 'status': '안전', 'emoji': '🟢', 'badge': '✅ 광고 집행 가능'}),
+    (70, {'css': 'tier-caution', 'status': '주의 필요', 'emoji': '🟡', 'badge': '⚠️ 신중한 검토 필요'}),
+    (0, {'css': 'tier-danger', 'status': '위험', 'emoji': '🔴', 'badge': '🚨 광고 집행 중단 권고'}),
+)
+
+def safety_tier(score):
+    """점수에 해당하는 안전성 표시 스타일 반환"""
+    return next((style for threshold, style in _SAFETY_TIERS if score >= threshold), _SAFETY_TIERS[-1][1])
+
+# 브랜드 세이프티 6개 카테고리 (결과 키, 카드 제목, 설명)
+_SAFETY_CATEGORIES = (
+    ("content_safety", "📋 1. 콘텐츠 안전성", "선정성, 폭력성, 혐오/차별, 언어"),
+    ("legal_ethics", "⚖️ 2. 법적/윤리적 리스크", "저작권, 허위정보, 불법 행위, 광고 표시"),
+    ("reputation", "📊 3. 평판 리스크", "과거 논란, 정치/종교, 구독자 평판"),
+    ("community", "👥 4. 커뮤니티 건전성", "댓글 관리, 구독자 특성, 타 인플루언서"),
+    ("brand_fit", "🎯 5. 브랜드 적합성", "가치관 부합, 경쟁사, 광고 품질"),
+    ("additional_checks", "✅ 6. 추가 확인 사항", "채널 투명성, 콘텐츠 일관성, 플랫폼 정책"),
+)
+
+# 기존 4개 체크리스트 항목 (결과 키, 표시명)
+_LEGACY_CHECKLIST_ITEMS = (
+    ("inappropriate_content", "부적절한 콘텐츠"),
+    ("controversial_topics", "논란성 주제"),
+    ("profanity", "비속어/욕설"),
+    ("brand_alignment", "브랜드 부합도"),
+)
+
+# 브랜드 안전성 대형 카드 템플릿 (format_map으로 값만 채움)
+_SAFETY_CARD_TMPL = """
+<div class="safety-card {css}">
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <div style="flex: 1; text-align: center;">
+            <div style="font-size: 5em; margin-bottom: 10px;">{emoji}</div>
+            <div class="tier-text" style="font-size: 3.5em; font-weight: bold; margin-bottom: 10px;">
+                {score}<span style="font-size: 0.5em; opacity: 0.7;">/100</span>
+            </div>
+            <div class="tier-text" style="font-size: 1.3em; font-weight: bold;">
+                {status}
+            </div>
+        </div>
+        <div style="width: 2px; height: 150px; background: rgba(0,0,0,0.1); margin: 0 30px;"></div>
+        <div style="flex: 2;">
+            <div class="safety-badge">
+                {badge}
+            </div>
+            <div style="font-size: 1.1em; line-height: 1.6; color: #333;">
+                <strong>평가:</strong> {reason}
+            </div>
+        </div>
+    </div>
+</div>
+"""
+
+# 6개 카테고리 카드 템플릿
+_SAFETY_CATEGORY_CARD_TMPL = """
+<div class="safety-category-card {css}">
+    <div class="tier-text" style="font-weight: bold; margin-bottom: 8px;">
+        {title}
+    </div>
+    <div class="tier-text" style="font-size: 2em; font-weight: bold; margin: 10px 0;">
+        {score}<span style="font-size: 0.5em; opacity: 0.7;">/100</span>
+    </div>
+    <div style="font-size: 0.9em; color: #666; margin-bottom: 8px;">
+        {desc}
+    </div>
+    <div style="font-size: 0.85em; color: #555;">
+        {issues}
+    </div>
+</div>
+"""
+
+# 기존 4개 체크리스트 항목 템플릿
+_CHECKLIST_ITEM_TMPL = """
+<div style="background-color: {bg}; padding: 12px; border-radius: 8px; border-left: 4px solid {border}; margin-bottom: 10px;">
+    <div style="font-size: 1.1em; font-weight: bold; margin-bottom: 5px;">
+        {icon} {label}
+    </div>
+    <div style="font-size: 0.95em; color: #666;">
+        {detail}
+    </div>
+</div>
+"""
+
+# 기존 체크리스트 상태별 표시 스타일
+_CHECK_STATUS_STYLES = {
+    'pass': {'icon': '✅', 'bg': '#e8f5e9', 'border': '#4caf50'},
+    'warning': {'icon': '⚠️', 'bg': '#fff3e0', 'border': '#ff9800'},
+    'fail': {'icon': '❌', 'bg': '#ffebee', 'border': '#f44336'},
+}
+
+# 발견된 리스크 항목 템플릿
+_RISK_FLAG_TMPL = """
+<div style="background-color: #ffebee; padding: 15px; border-radius: 8px; margin: 10px 0; border-left: 5px solid #f44336;">
+    <strong>⚠️ {flag}</strong>
+</div>
+"""
+
+@st.cache_data(max_entries=64, show_spinner=False)  # 같은 AI 결과면 카드 HTML 재생성 생략 (결과 본문은 지문으로 대신 해시)
+def build_safety_html(ai_result_hash, _ai_result, with_categories=True):
+    """브랜드 안전성 대형 카드와 6개 카테고리 카드 HTML을 하나의 문자열로 생성 (with_categories=False면 대형 카드만)"""
+    ai_result = _ai_result
+    safety_score = ai_result['brand_safety']['score']
+    tier = safety_tier(safety_score)
+
+    main_html = _SAFETY_CARD_TMPL.format_map({
+        **tier,
+        'score': safety_score,
+        'reason': ai_result['recommendation']['reason'],
+    })
+    if not with_categories:
+        return main_html
+
+    category_html = []
+    for key, title, desc in _SAFETY_CATEGORIES:
+        if key not in ai_result:
+            continue
+
+        category_data = ai_result[key]
+        score = category_data.get('score', 0)
+        issues = category_data.get('issues', [])
+
+        # 점수에 따른 색상 (브랜드 안전성 카드와 같은 기준표 사용)
+        category_tier = safety_tier(score)
+
+        # 이슈 표시 (항목마다 f-string을 만들지 않고 구분자에 글머리 기호 포함)
+        issues_html = ("• " + "<br>• ".join(map(str, issues))) if issues else "• 특이사항 없음"
+
+        category_html.append(_SAFETY_CATEGORY_CARD_TMPL.format_map({
+            **category_tier,
+            'title': title,
+            'score': score,
+            'desc': desc,
+            'issues': issues_html,
+        }))
+
+    # 카테고리 카드가 하나도 없으면 체크리스트 제목 없이 대형 카드만 반환
+    if not category_html:
+        return main_html
+
+    # 대형 카드 + 체크리스트 제목 + 3열 카드 그리드를 한 번의 markdown 요소로 전송 (st.columns 불필요)
+    # HTML 블록이 끊기지 않도록 카드 사이에 빈 줄을 넣지 않음
+    grid_html = (
+        '<div class="safety-grid">'
+        + "".join(html.strip() for html in category_html)
+        + "</div>"
+    )
+    return main_html + "\n\n#### 🔍 브랜드 세이프티 체크리스트\n\n" + grid_html
 
 # --- 메인 로직 ---
 if youtube_api_loaded and youtube_api_key:
@@ -529,39 +1023,60 @@ if youtube_api_loaded and youtube_api_key:
 
     st.markdown("---")
 
-    # URL 입력
-    youtube_url = st.text_input(
-        "유튜브 채널 또는 영상 URL",
-        placeholder="예: https://www.youtube.com/@channelname 또는 https://www.youtube.com/watch?v=VIDEO_ID",
-        key="youtube_url_input",
-        help="채널 URL 또는 영상 URL 둘 다 가능합니다"
-    )
+    # URL 입력 (폼으로 감싸 입력 중에는 재실행하지 않고 제출 시에만 분석)
+    with st.form("url_form"):
+        youtube_url = st.text_input(
+            "유튜브 채널 또는 영상 URL",
+            placeholder="예: https://www.youtube.com/@channelname 또는 https://www.youtube.com/watch?v=VIDEO_ID",
+            key="youtube_url_input",
+            help="채널 URL 또는 영상 URL 둘 다 가능합니다"
+        )
+        url_submitted = st.form_submit_button("🔍 분석하기", use_container_width=True)
+
+    # 제출 버튼을 누르면 (같은 URL이어도) 저장된 조회 결과를 버리고 새로 조회
+    if url_submitted:
+        st.session_state.pop('analysis', None)
 
     # 처리 시작 (URL 입력시 유튜브 정보 표시)
     if youtube_url:
         with st.spinner("채널 정보를 분석하는 중..."):
             # 먼저 영상 ID 확인
             video_id = extract_video_id(youtube_url)
-            channel_info = None
-
             if video_id:
-                # 영상 URL인 경우: 영상에서 채널 ID 추출
                 st.info("🎥 영상 URL이 감지되었습니다. 해당 영상의 채널을 분석합니다.")
-                channel_id = get_channel_id_from_video(video_id, youtube_api_key)
-                if channel_id:
-                    channel_info = get_channel_info_by_id(channel_id, youtube_api_key)
-            else:
-                # 채널 URL인 경우: 기존 로직
-                channel_identifier, pattern = extract_channel_id(youtube_url)
 
-                if not channel_identifier:
-                    st.error("❌ 올바른 유튜브 채널 또는 영상 URL을 입력해주세요.")
+            analysis = st.session_state.get('analysis')
+
+            if analysis is not None and analysis['url'] == youtube_url:
+                # 같은 URL로 재실행된 경우(CPM 슬라이더, AI 버튼 등) 저장된 조회 결과 재사용
+                channel_info = analysis['channel_info']
+                recent_videos = analysis['recent_videos']
+                videos_future = None
+            else:
+                channel_info = None
+                videos_future = None
+
+                if video_id:
+                    # 영상 URL인 경우: 영상에서 채널 ID 추출
+                    channel_id = _fetch_or_none(get_channel_id_from_video, video_id, youtube_api_key)
+                    if channel_id:
+                        channel_info, videos_future = fetch_channel_and_videos(channel_id, youtube_api_key)
                 else:
-                    # 채널 정보 가져오기
-                    if pattern and 'channel/' in pattern:
-                        channel_info = get_channel_info_by_id(channel_identifier, youtube_api_key)
+                    # 채널 URL인 경우: 기존 로직
+                    channel_identifier, url_kind = extract_channel_id(youtube_url)
+
+                    if not channel_identifier:
+                        st.error("❌ 올바른 유튜브 채널 또는 영상 URL을 입력해주세요.")
                     else:
-                        channel_info = get_channel_info_by_username(channel_identifier, youtube_api_key)
+                        # 채널 정보 가져오기
+                        if url_kind == 'channel':
+                            channel_id = channel_identifier
+                        else:
+                            # 핸들 → 채널 ID 매핑은 오래 캐시하고, 이후는 ID 기반 조회로 통일
+                            channel_id = _fetch_or_none(resolve_handle_to_channel_id, channel_identifier, youtube_api_key)
+
+                        if channel_id:
+                            channel_info, videos_future = fetch_channel_and_videos(channel_id, youtube_api_key)
 
             if not channel_info:
                 st.error("❌ 채널 정보를 가져올 수 없습니다. URL을 확인해주세요.")
@@ -578,19 +1093,51 @@ if youtube_api_loaded and youtube_api_key:
                 # 전체 평균 조회수 계산
                 overall_avg_views = total_view_count / video_count if video_count > 0 else 0
 
-                # 최근 영상 분석
-                uploads_playlist_id = channel_info['contentDetails']['relatedPlaylists']['uploads']
-                recent_videos = get_recent_videos(uploads_playlist_id, youtube_api_key, max_results=10)
+                # AI 분석 버튼 자리 (채널 개요보다 위에 표시)
+                ai_button_area = st.container()
+
+                # === 결과 표시 === (영상 응답을 기다리는 동안 채널 개요 먼저 렌더링)
+                st.markdown("---")
+                st.header("📊 채널 개요")
+
+                # 채널 기본 정보
+                col_info1, col_info2 = st.columns([1, 2])
+
+                with col_info1:
+                    if 'thumbnails' in snippet:
+                        st.image(fetch_thumbnail(snippet['thumbnails']['medium']['url']), width=200)
+
+                with col_info2:
+                    st.subheader(snippet['title'])
+                    # 4줄을 한 번의 markdown 요소로 전송 (문단 구분은 그대로)
+                    st.markdown(
+                        f"**등급:** {tier_name} ({tier_range} 구독자)\n\n"
+                        f"**구독자:** {format_number(subscriber_count)}명\n\n"
+                        f"**총 영상:** {format_number(video_count)}개\n\n"
+                        f"**총 조회수:** {format_number(total_view_count)}회"
+                    )
+
+                # 최근 영상 분석 (백그라운드 조회 결과 수신)
+                if videos_future is not None:
+                    recent_videos = videos_future.result() or []
+
+                    # 영상을 실제로 받아온 경우에만 결과를 저장 (빈 결과는 다음 재실행에서 다시 조회)
+                    if recent_videos:
+                        st.session_state['analysis'] = {
+                            'url': youtube_url,
+                            'channel_info': channel_info,
+                            'recent_videos': recent_videos,
+                        }
 
                 if recent_videos:
-                    recent_avg_views = calculate_average_views(recent_videos)
-                    avg_likes, avg_comments = calculate_average_stats(recent_videos)
+                    # 영상별 지표를 한 번만 추출해 평균/참여율을 벡터 연산으로 계산
+                    video_stats_array = get_video_stats_array(recent_videos)
+                    # 영상 제목은 한 번만 잘라서 표와 AI 프롬프트에 함께 사용
+                    video_titles = [video['snippet']['title'][:60] for video in recent_videos]
+                    recent_avg_views, avg_likes, avg_comments = calculate_average_stats(video_stats_array)
 
-                    engagement_rates = [
-                        calculate_engagement_rate(video['statistics'])
-                        for video in recent_videos
-                    ]
-                    avg_engagement_rate = sum(engagement_rates) / len(engagement_rates)
+                    engagement_rates = calculate_engagement_rates(video_stats_array)
+                    avg_engagement_rate = float(engagement_rates.mean())
 
                     # 전체 평균과 최근 평균 비교
                     overall_ratio = (overall_avg_views / subscriber_count) * 100 if subscriber_count > 0 else 0
@@ -617,57 +1164,74 @@ if youtube_api_loaded and youtube_api_key:
                         cpm_krw=cpm_value
                     )
 
-                    # === AI 분석 버튼 (상단 배치) ===
-                    st.markdown("---")
-                    if GEMINI_AVAILABLE and gemini_api_loaded:
-                        # 하늘색 버튼 스타일 적용
-                        st.markdown("""
-                        <style>
-                        div[data-testid="stButton"] > button[kind="primary"] {
-                            background: linear-gradient(135deg, #42a5f5 0%, #1e88e5 100%) !important;
-                            border: none !important;
-                            font-size: 1.2em !important;
-                            font-weight: bold !important;
-                            padding: 15px !important;
-                            box-shadow: 0 4px 6px rgba(0,0,0,0.1) !important;
-                        }
-                        div[data-testid="stButton"] > button[kind="primary"]:hover {
-                            background: linear-gradient(135deg, #1e88e5 0%, #1565c0 100%) !important;
-                            box-shadow: 0 6px 8px rgba(0,0,0,0.15) !important;
-                        }
-                        </style>
-                        """, unsafe_allow_html=True)
-
-                        ai_button_clicked = st.button(
-                            "🤖 AI 분석 시작",
-                            type="primary",
-                            use_container_width=True,
-                            key="ai_analysis_btn_top"
-                        )
-
-                        # 버튼 바로 아래 애니메이션 placeholder
-                        progress_placeholder_top = st.empty()
-                    else:
-                        ai_button_clicked = False
-                        progress_placeholder_top = None
+                    # 화면에 반복 표시되는 숫자는 렌더링 전에 한 번만 포맷
+                    fmt = {k: format_number(v) for k, v in cost_data.items() if type(v) is int}
+                    fmt.update(
+                        overall_avg_views=format_number(int(overall_avg_views)),
+                        recent_avg_views=format_number(int(recent_avg_views)),
+                        avg_likes=format_number(avg_likes),
+                        avg_comments=format_number(avg_comments),
+                        cpm=format_number(cpm_value),
+                    )
 
-                    # === 결과 표시 ===
-                    st.markdown("---")
-                    st.header("📊 채널 개요")
+                    # === AI 분석 버튼 (상단 배치) ===
+                    with ai_button_area:
+                        st.markdown("---")
+                        if GEMINI_AVAILABLE and gemini_api_loaded:
+                            # 하늘색 버튼 스타일 적용
+                            st.markdown("""
+                            <style>
+                            div[data-testid="stButton"] > button[kind="primary"] {
+                                background: linear-gradient(135deg, #42a5f5 0%, #1e88e5 100%) !important;
+                                border: none !important;
+                                font-size: 1.2em !important;
+                                font-weight: bold !important;
+                                padding: 15px !important;
+                                box-shadow: 0 4px 6px rgba(0,0,0,0.1) !important;
+                            }
+                            div[data-testid="stButton"] > button[kind="primary"]:hover {
+                                background: linear-gradient(135deg, #1e88e5 0%, #1565c0 100%) !important;
+                                box-shadow: 0 6px 8px rgba(0,0,0,0.15) !important;
+                            }
+                            </style>
+                            """, unsafe_allow_html=True)
 
-                    # 채널 기본 정보
-                    col_info1, col_info2 = st.columns([1, 2])
+                            ai_button_clicked = st.button(
+                                "🤖 AI 분석 시작",
+                                type="primary",
+                                use_container_width=True,
+                                key="ai_analysis_btn_top"
+                            )
 
-                    with col_info1:
-                        if 'thumbnails' in snippet:
-                            st.image(snippet['thumbnails']['medium']['url'], width=200)
+                            # 버튼 바로 아래 애니메이션 placeholder
+                            progress_placeholder_top = st.empty()
 
-                    with col_info2:
-                        st.subheader(snippet['title'])
-                        st.write(f"**등급:** {tier_name} ({tier_range} 구독자)")
-                        st.write(f"**구독자:** {format_number(subscriber_count)}명")
-                        st.write(f"**총 영상:** {format_number(video_count)}개")
-                        st.write(f"**총 조회수:** {format_number(total_view_count)}회")
+                            # 6개 카테고리와 겹치는 기존 4개 체크리스트는 선택 시에만 표시
+                            st.checkbox("기존 4개 상세 체크리스트도 표시", key="show_legacy_checklist")
+                            st.checkbox("광고 중단 권고 채널도 세부 항목 표시", key="show_blocked_details")
+                        else:
+                            ai_button_clicked = False
+                            progress_placeholder_top = None
+
+                    # AI 분석 대상 (채널 ID + 최근 영상 ID 목록, 캐시 키 및 세션 보관 결과 확인에 사용)
+                    ai_key = (channel_info['id'], tuple(video.get('id') for video in recent_videos))
+
+                    # 버튼 클릭 즉시 AI 분석을 백그라운드로 시작 (아래 결과 화면 렌더링과 겹쳐 실행)
+                    ai_future = None
+                    if ai_button_clicked:
+                        _configure_gemini(gemini_api_key)
+                        ai_future = submit_with_ctx(
+                            run_ai_analysis,
+                            *ai_key,
+                            gemini_api_loaded,
+                            snippet['title'],
+                            subscriber_count,
+                            int(avg_views),
+                            round(avg_engagement_rate, 2),
+                            recent_videos,
+                            video_titles,
+                            executor=_get_ai_executor()
+                        )
 
                     # 참여 지표
                     st.markdown("---")
@@ -682,38 +1246,33 @@ if youtube_api_loaded and youtube_api_key:
                         else:
                             st.success(f"🚀 **성장 중**: 최근 영상이 전체 평균({overall_ratio:.1f}%)보다 높습니다({recent_ratio:.1f}%). 최근 평균으로 평가합니다.")
 
-                    # 전체 평균과 최근 평균을 나란히 표시
-                    comp_col1, comp_col2 = st.columns(2)
-
-                    with comp_col1:
-                        st.markdown(f"""
-                        <div style="background: rgba(33, 150, 243, 0.1); padding: 15px; border-radius: 8px; border-left: 4px solid #2196f3;">
+                    # 전체 평균과 최근 평균을 나란히 표시 (두 카드를 flex 컨테이너 하나로 전송)
+                    st.markdown(f"""
+                    <div style="display: flex; flex-wrap: wrap; gap: 1rem;">
+                        <div style="flex: 1; min-width: 240px; background: rgba(33, 150, 243, 0.1); padding: 15px; border-radius: 8px; border-left: 4px solid #2196f3;">
                             <div style="font-size: 0.9em; color: #666; margin-bottom: 5px;">
                                 전체 평균 (총 {video_count}개 영상)
                             </div>
                             <div style="font-size: 1.5em; font-weight: bold; color: #2196f3;">
-                                {format_number(int(overall_avg_views))}회
+                                {fmt['overall_avg_views']}회
                             </div>
                             <div style="font-size: 0.85em; color: #555; margin-top: 5px;">
                                 구독자 대비: {overall_ratio:.1f}%
                             </div>
                         </div>
-                        """, unsafe_allow_html=True)
-
-                    with comp_col2:
-                        st.markdown(f"""
-                        <div style="background: rgba(76, 175, 80, 0.1); padding: 15px; border-radius: 8px; border-left: 4px solid #4caf50;">
+                        <div style="flex: 1; min-width: 240px; background: rgba(76, 175, 80, 0.1); padding: 15px; border-radius: 8px; border-left: 4px solid #4caf50;">
                             <div style="font-size: 0.9em; color: #666; margin-bottom: 5px;">
                                 최근 평균 (최근 10개 영상)
                             </div>
                             <div style="font-size: 1.5em; font-weight: bold; color: #4caf50;">
-                                {format_number(int(recent_avg_views))}회
+                                {fmt['recent_avg_views']}회
                             </div>
                             <div style="font-size: 0.85em; color: #555; margin-top: 5px;">
                                 구독자 대비: {recent_ratio:.1f}%
                             </div>
                         </div>
-                        """, unsafe_allow_html=True)
+                    </div>
+                    """, unsafe_allow_html=True)
 
                     st.caption(f"💡 비용 산정 기준: **{ratio_note}**")
 
@@ -743,7 +1302,7 @@ if youtube_api_loaded and youtube_api_key:
                                 </div>
                             </div>
                             <div style="font-size: 1.5em; font-weight: bold; color: #0066cc;">
-                                {format_number(int(recent_avg_views))}회
+                                {fmt['recent_avg_views']}회
                             </div>
                         </div>
                         """, unsafe_allow_html=True)
@@ -803,7 +1362,7 @@ if youtube_api_loaded and youtube_api_key:
                                 </div>
                             </div>
                             <div style="font-size: 1.5em; font-weight: bold; color: #0066cc;">
-                                {format_number(avg_likes)}
+                                {fmt['avg_likes']}
                             </div>
                         </div>
                         """, unsafe_allow_html=True)
@@ -832,7 +1391,7 @@ if youtube_api_loaded and youtube_api_key:
                                 </div>
                             </div>
                             <div style="font-size: 1.5em; font-weight: bold; color: #0066cc;">
-                                {format_number(avg_comments)}
+                                {fmt['avg_comments']}
                             </div>
                         </div>
                         """, unsafe_allow_html=True)
@@ -890,43 +1449,7 @@ if youtube_api_loaded and youtube_api_key:
 
                     # 참여 질 설명
                     with st.expander("💡 참여 질이란? (클릭하여 자세히 보기)"):
-                        st.markdown("""
-                        ### 📊 댓글/좋아요 비율이란?
-
-                        **진짜 팬 vs 이벤트 참여자를 구분하는 지표입니다.**
-
-                        **비율 기준:**
-                        - ✅ **15% 이상**: 대화형 커뮤니티 (우수)
-                          - 시청자들이 적극적으로 댓글을 남기고 소통합니다
-                          - 좋아요 100개당 댓글 15개 이상
-                          - 진정한 팬층이 형성된 채널
-
-                        - ✓ **5-15%**: 정상 범위
-                          - 일반적인 수준의 참여도
-                          - 좋아요 100개당 댓글 5-15개
-                          - 평균적인 채널
-
-                        - ⚠️ **5% 미만**: 이벤트형 (저품질)
-                          - 좋아요 100개당 댓글 5개 미만
-                          - "좋아요 누르면 경품 추첨" 같은 이벤트로 유입된 참여자
-                          - 실제 콘텐츠에 관심이 없는 시청자 다수
-
-                        **왜 중요한가요?**
-
-                        **이벤트형 채널의 문제점:**
-                        1. **낮은 광고 효과**: "좋아요만 누르고 가는" 시청자는 광고를 제대로 보지 않습니다
-                        2. **허수 참여**: 경품 때문에 온 사람들은 브랜드에 관심이 없습니다
-                        3. **전환율 낮음**: 실제 구매로 이어질 가능성이 매우 낮습니다
-
-                        **대화형 커뮤니티의 장점:**
-                        1. **진성 팬층**: 댓글을 남기는 사람은 콘텐츠를 진지하게 시청합니다
-                        2. **높은 신뢰도**: 인플루언서와 팬의 관계가 돈독합니다
-                        3. **광고 효과 극대화**: 추천을 신뢰하고 실제 구매로 이어집니다
-
-                        **광고주 입장에서:**
-                        - 댓글이 많은 채널 = 진짜 영향력이 있는 채널
-                        - 좋아요만 많은 채널 = 이벤트로 부풀려진 허수일 가능성
-                        """)
+                        st.markdown(_ENGAGEMENT_QUALITY_HELP_MD)
 
                     # 채널 건강도 표시 (v4.3 신규)
                     channel_health = cost_data.get('channel_health', {})
@@ -937,9 +1460,11 @@ if youtube_api_loaded and youtube_api_key:
                         health_desc = channel_health['description']
                         health_color = channel_health['color']
                         health_multiplier = channel_health['multiplier']
+                        # 배경/아이콘 rgba에 쓰는 RGB 값은 한 번만 계산
+                        health_rgb = ", ".join(str(int(health_color[i:i + 2], 16)) for i in (1, 3, 5))
 
                         st.markdown(f"""
-                        <div style="background: linear-gradient(135deg, rgba({int(health_color[1:3], 16)}, {int(health_color[3:5], 16)}, {int(health_color[5:7], 16)}, 0.1) 0%, #ffffff 100%); padding: 20px; border-radius: 12px; border-left: 5px solid {health_color}; margin: 15px 0;">
+                        <div style="background: linear-gradient(135deg, rgba({health_rgb}, 0.1) 0%, #ffffff 100%); padding: 20px; border-radius: 12px; border-left: 5px solid {health_color}; margin: 15px 0;">
                             <div style="display: flex; align-items: center; justify-content: space-between;">
                                 <div style="flex: 1;">
                                     <div style="display: flex; align-items: center; gap: 10px; margin-bottom: 5px;">
@@ -947,7 +1472,7 @@ if youtube_api_loaded and youtube_api_key:
                                             {health_emoji} 채널 건강도: {health_level}
                                         </div>
                                         <div class="tooltip-container">
-                                            <div class="tooltip-icon" style="background-color: rgba({int(health_color[1:3], 16)}, {int(health_color[3:5], 16)}, {int(health_color[5:7], 16)}, 0.15); border-color: {health_color}; color: {health_color};">?</div>
+                                            <div class="tooltip-icon" style="background-color: rgba({health_rgb}, 0.15); border-color: {health_color}; color: {health_color};">?</div>
                                             <div class="tooltip-text" style="width: 360px;">
                                                 <strong>채널 건강도란?</strong><br>
                                                 <div class="formula">평균 조회수 ÷ 구독자 수 × 100</div><br>
@@ -986,33 +1511,7 @@ if youtube_api_loaded and youtube_api_key:
 
                         # 건강도 기준 설명
                         with st.expander("💡 채널 건강도란? (클릭하여 자세히 보기)"):
-                            st.markdown("""
-                            ### 📊 조회수/구독자 비율이란?
-
-                            **건강한 채널의 지표:**
-                            - 구독자 수만 많은 게 아니라, 실제로 시청하는 구독자가 많은 채널
-                            - 조회수가 구독자 수에 비례하는 활발한 채널
-
-                            **비율 기준:**
-                            - 🔥 **30% 이상**: 초건강 (10만 구독자 → 3만+ 조회수)
-                            - ✅ **20-30%**: 매우 건강 (10만 구독자 → 2-3만 조회수)
-                            - ✅ **15-20%**: 건강 (10만 구독자 → 1.5-2만 조회수)
-                            - ⚖️ **10-15%**: 정상 (10만 구독자 → 1-1.5만 조회수)
-                            - ⚠️ **7-10%**: 약간 약화 (10만 구독자 → 7천-1만 조회수)
-                            - ⚠️ **5-7%**: 약화 (10만 구독자 → 5천-7천 조회수)
-                            - 🟡 **3-5%**: 죽어감 (10만 구독자 → 3천-5천 조회수)
-                            - 🔴 **3% 미만**: 죽음 (구독자만 많고 조회수 없음)
-
-                            **왜 중요한가요?**
-                            - 구독자 수는 "과거의 영광"일 수 있습니다
-                            - 실제 광고 효과는 "현재 조회수"로 결정됩니다
-                            - 건강도가 낮으면 광고 집행 효과가 떨어집니다
-
-                            **티어 조정 계수:**
-                            - 건강도가 낮은 채널은 광고 비용이 하향 조정됩니다
-                            - 반대로 매우 건강한 채널은 프리미엄이 붙습니다
-                            - 공정한 가격 책정을 위한 시스템입니다
-                            """)
+                            st.markdown(_HEALTH_HELP_MD)
 
                     # 채널 프리미엄 정보 표시 (v4.4 신규)
                     premium_details = cost_data.get('premium_details', {})
@@ -1026,143 +1525,36 @@ if youtube_api_loaded and youtube_api_key:
                         # 4개의 프리미엄 요소를 2x2 그리드로 표시
                         prem_col1, prem_col2 = st.columns(2)
 
-                        with prem_col1:
-                            # 건강도
-                            health = premium_details['health']
-                            st.markdown(f"""
-                            <div style="background: rgba(255, 107, 53, 0.05); padding: 15px; border-radius: 8px; border-left: 4px solid {health['color']}; margin-bottom: 10px;">
-                                <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 5px;">
-                                    <div style="font-size: 1.1em; font-weight: bold;">
-                                        {health['emoji']} 채널 건강도
-                                    </div>
-                                    <div class="tooltip-container">
-                                        <div class="tooltip-icon">?</div>
-                                        <div class="tooltip-text" style="width: 340px;">
-                                            <strong>채널 건강도란?</strong><br>
-                                            평균 조회수가 구독자 수 대비 얼마나 되는지 측정합니다.<br><br>
-                                            <span class="benchmark">✓ 등급:</span><br>
-                                            • 초건강 (30%+): ×1.20<br>
-                                            • 매우 건강 (20-30%): ×1.15<br>
-                                            • 건강 (15-20%): ×1.10<br>
-                                            • 정상 (10-15%): ×1.00<br>
-                                            • 약화 (5-10%): ×0.70~0.85<br>
-                                            • 죽어감 (5% 미만): ×0.30~0.50<br><br>
-                                            건강할수록 광고 비용이 올라갑니다!
-                                        </div>
-                                    </div>
-                                </div>
-                                <div style="color: #555; margin-bottom: 5px;">
-                                    상태: <strong>{health['level']}</strong> (×{health['multiplier']})
-                                </div>
-                                <div style="font-size: 0.85em; color: #666;">
-                                    {health['description']}
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
+                        health = premium_details['health']
+                        consistency = premium_details['consistency']
+                        growth = premium_details['growth']
+                        loyalty = premium_details['loyalty']
+
+                        # (배경, 테두리, 제목, 툴팁, 라벨, 값, 계수, 설명)
+                        premium_cards = {
+                            'health': ("rgba(255, 107, 53, 0.05)", health['color'], f"{health['emoji']} 채널 건강도",
+                                       "상태", health['level'], health['multiplier'], health['description']),
+                            'consistency': ("rgba(76, 175, 80, 0.05)", "#4caf50", "🎯 업로드 일관성",
+                                            "빈도", consistency['upload_frequency'], consistency['multiplier'], consistency['description']),
+                            'growth': ("rgba(33, 150, 243, 0.05)", "#2196f3", "📈 성장세",
+                                       "상태", growth['status'], growth['multiplier'], growth['description']),
+                            'loyalty': ("rgba(156, 39, 176, 0.05)", "#9c27b0", "💬 팬덤 충성도",
+                                        "상태", loyalty['status'], loyalty['multiplier'], loyalty['description']),
+                        }
+                        premium_html = {
+                            key: _PREMIUM_CARD_TMPL.format_map(dict(
+                                bg=bg, border=border, title=title, tooltip=_PREMIUM_TOOLTIPS[key],
+                                label=label, value=value, multiplier=multiplier, description=description
+                            ))
+                            for key, (bg, border, title, label, value, multiplier, description) in premium_cards.items()
+                        }
 
-                            # 일관성
-                            consistency = premium_details['consistency']
-                            st.markdown(f"""
-                            <div style="background: rgba(76, 175, 80, 0.05); padding: 15px; border-radius: 8px; border-left: 4px solid #4caf50; margin-bottom: 10px;">
-                                <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 5px;">
-                                    <div style="font-size: 1.1em; font-weight: bold;">
-                                        🎯 업로드 일관성
-                                    </div>
-                                    <div class="tooltip-container">
-                                        <div class="tooltip-icon">?</div>
-                                        <div class="tooltip-text" style="width: 340px;">
-                                            <strong>업로드 일관성이란?</strong><br>
-                                            채널이 얼마나 꾸준히 영상을 올리는지 측정합니다.<br><br>
-                                            <div class="formula">영상 수 ÷ 채널 개설 일수</div><br>
-                                            <span class="benchmark">✓ 등급:</span><br>
-                                            • <strong>매우 규칙적:</strong> 주 7회 이상 (×1.08)<br>
-                                            • <strong>규칙적:</strong> 주 3-7회 (×1.05)<br>
-                                            • <strong>보통:</strong> 주 1-3회 (×1.00)<br>
-                                            • <strong>불규칙:</strong> 월 1-4회 (×0.97)<br>
-                                            • <strong>비활성:</strong> 월 1회 미만 (×0.90)<br><br>
-                                            규칙적인 채널은 구독자 이탈이 적고, 광고 효과가 오래 지속됩니다!
-                                        </div>
-                                    </div>
-                                </div>
-                                <div style="color: #555; margin-bottom: 5px;">
-                                    빈도: <strong>{consistency['upload_frequency']}</strong> (×{consistency['multiplier']})
-                                </div>
-                                <div style="font-size: 0.85em; color: #666;">
-                                    {consistency['description']}
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
+                        # 열마다 카드 2개를 한 번에 렌더링 (델타 메시지 절감)
+                        with prem_col1:
+                            st.markdown(premium_html['health'] + premium_html['consistency'], unsafe_allow_html=True)
 
                         with prem_col2:
-                            # 성장세
-                            growth = premium_details['growth']
-                            st.markdown(f"""
-                            <div style="background: rgba(33, 150, 243, 0.05); padding: 15px; border-radius: 8px; border-left: 4px solid #2196f3; margin-bottom: 10px;">
-                                <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 5px;">
-                                    <div style="font-size: 1.1em; font-weight: bold;">
-                                        📈 성장세
-                                    </div>
-                                    <div class="tooltip-container">
-                                        <div class="tooltip-icon">?</div>
-                                        <div class="tooltip-text" style="width: 340px;">
-                                            <strong>성장세란?</strong><br>
-                                            최근 90일 조회수를 전체 평균과 비교하여 채널이 성장 중인지 판단합니다.<br><br>
-                                            <div class="formula">최근 90일 평균 ÷ 전체 평균 × 100</div><br>
-                                            <span class="benchmark">✓ 등급:</span><br>
-                                            • <strong>급성장:</strong> 최근이 50% 이상 높음 (×1.15)<br>
-                                            • <strong>성장:</strong> 최근이 20-50% 높음 (×1.10)<br>
-                                            • <strong>약성장:</strong> 최근이 5-20% 높음 (×1.05)<br>
-                                            • <strong>안정:</strong> ±5% 이내 (×1.00)<br>
-                                            • <strong>하락:</strong> 최근이 5-20% 낮음 (×0.95)<br>
-                                            • <strong>급락:</strong> 최근이 20% 이상 낮음 (×0.85)<br><br>
-                                            성장 중인 채널은 미래 가치가 높아 프리미엄이 붙습니다!
-                                        </div>
-                                    </div>
-                                </div>
-                                <div style="color: #555; margin-bottom: 5px;">
-                                    상태: <strong>{growth['status']}</strong> (×{growth['multiplier']})
-                                </div>
-                                <div style="font-size: 0.85em; color: #666;">
-                                    {growth['description']}
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-
-                            # 팬덤 충성도
-                            loyalty = premium_details['loyalty']
-                            st.markdown(f"""
-                            <div style="background: rgba(156, 39, 176, 0.05); padding: 15px; border-radius: 8px; border-left: 4px solid #9c27b0; margin-bottom: 10px;">
-                                <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 5px;">
-                                    <div style="font-size: 1.1em; font-weight: bold;">
-                                        💬 팬덤 충성도
-                                    </div>
-                                    <div class="tooltip-container">
-                                        <div class="tooltip-icon">?</div>
-                                        <div class="tooltip-text" style="width: 340px;">
-                                            <strong>팬덤 충성도란?</strong><br>
-                                            댓글 비율을 통해 팬층이 얼마나 충성스러운지 측정합니다.<br><br>
-                                            <div class="formula">(댓글 수 ÷ 조회수) × 100</div><br>
-                                            <span class="benchmark">✓ 등급:</span><br>
-                                            • <strong>최상:</strong> 0.5% 이상 (×1.10)<br>
-                                            &nbsp;&nbsp;→ 조회수 1만당 댓글 50개 이상<br>
-                                            • <strong>우수:</strong> 0.3-0.5% (×1.05)<br>
-                                            &nbsp;&nbsp;→ 조회수 1만당 댓글 30-50개<br>
-                                            • <strong>양호:</strong> 0.1-0.3% (×1.00)<br>
-                                            &nbsp;&nbsp;→ 조회수 1만당 댓글 10-30개<br>
-                                            • <strong>낮음:</strong> 0.1% 미만 (×0.97)<br>
-                                            &nbsp;&nbsp;→ 조회수 1만당 댓글 10개 미만<br><br>
-                                            댓글이 많은 채널은 진성 팬이 많아 광고 효과가 높습니다!
-                                        </div>
-                                    </div>
-                                </div>
-                                <div style="color: #555; margin-bottom: 5px;">
-                                    상태: <strong>{loyalty['status']}</strong> (×{loyalty['multiplier']})
-                                </div>
-                                <div style="font-size: 0.85em; color: #666;">
-                                    {loyalty['description']}
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
+                            st.markdown(premium_html['growth'] + premium_html['loyalty'], unsafe_allow_html=True)
 
                         # 종합 프리미엄 계수
                         total_multiplier = premium_details['total_multiplier']
@@ -1182,122 +1574,97 @@ if youtube_api_loaded and youtube_api_key:
                     st.markdown("---")
                     st.subheader("💰 1회 광고 적정 비용")
 
-                    final_cost = cost_data['final_cost']
-                    min_cost = cost_data['min_cost']
-                    max_cost = cost_data['max_cost']
-
                     cost_col1, cost_col2, cost_col3 = st.columns(3)
 
                     with cost_col1:
-                        st.markdown(f"""
-                        <div class="cost-card">
-                            <div class="cost-label">최소</div>
-                            <div class="cost-value" style="font-size: 1.5em;">{format_number(min_cost)}원</div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                        st.metric("최소", f"{fmt['min_cost']}원")
 
                     with cost_col2:
-                        st.markdown(f"""
-                        <div class="cost-card" style="border-color: #1976d2; border-width: 3px;">
-                            <div class="cost-label">평균 (권장)</div>
-                            <div class="cost-value">{format_number(final_cost)}원</div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                        st.metric("평균 (권장)", f"{fmt['final_cost']}원")
 
                     with cost_col3:
-                        st.markdown(f"""
-                        <div class="cost-card">
-                            <div class="cost-label">최대</div>
-                            <div class="cost-value" style="font-size: 1.5em;">{format_number(max_cost)}원</div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                        st.metric("최대", f"{fmt['max_cost']}원")
 
-                    st.caption(f"💡 한국 시장 기준 | 브랜디드 PPL (30초~1분 노출) | CPM: {format_number(cpm_value)}원")
+                    st.caption(f"💡 한국 시장 기준 | 브랜디드 PPL (30초~1분 노출) | CPM: {fmt['cpm']}원")
 
                     # 최근 영상 분석
                     st.markdown("---")
                     st.subheader("🎥 최근 영상 분석 (최근 10개)")
 
-                    # 테이블
-                    video_table_data = []
-                    for i, video in enumerate(recent_videos, 1):
-                        video_stats = video['statistics']
-                        video_snippet = video['snippet']
-
-                        title = video_snippet['title'][:40] + "..." if len(video_snippet['title']) > 40 else video_snippet['title']
-                        views = int(video_stats.get('viewCount', 0))
-                        likes = int(video_stats.get('likeCount', 0))
-                        comments = int(video_stats.get('commentCount', 0))
-                        engagement = calculate_engagement_rate(video_stats)
-
-                        video_table_data.append({
-                            '순서': f"{i}",
-                            '제목': title,
-                            '조회수': format_number(views),
-                            '좋아요': format_number(likes),
-                            '댓글': format_number(comments),
-                            '참여율': f"{engagement}%"
-                        })
-
-                    df_videos = pd.DataFrame(video_table_data)
-                    st.dataframe(df_videos, use_container_width=True, hide_index=True)
+                    # 테이블 (상단에서 추출한 영상별 지표 배열 재사용)
+                    title_series = pd.Series(video_titles)
+                    titles = title_series.str[:40].where(title_series.str.len() <= 40, title_series.str[:40] + "...")
+                    video_labels = pd.Index([f"{i}" for i in range(1, len(recent_videos) + 1)], name='영상')
+
+                    # 수치 열은 배열을 그대로 감싸 한 번만 만들고, 표와 차트가 함께 사용
+                    df_stats = pd.DataFrame(video_stats_array, index=video_labels, columns=['조회수', '좋아요', '댓글'])
+                    df_stats['참여율'] = engagement_rates
+
+                    # 수치 열은 숫자 그대로 두고 표시 형식만 Styler로 지정 (행별 문자열 변환 없음)
+                    df_videos = df_stats.reset_index(names='순서')
+                    df_videos.insert(1, '제목', titles.to_numpy())
+                    st.dataframe(
+                        df_videos.style.format({'조회수': '{:,}', '좋아요': '{:,}', '댓글': '{:,}', '참여율': '{}%'}),
+                        use_container_width=True,
+                        hide_index=True
+                    )
 
                     # 차트
                     chart_col1, chart_col2 = st.columns(2)
 
                     with chart_col1:
                         st.write("**조회수 추이**")
-                        chart_data = pd.DataFrame({
-                            '영상': [f"{i+1}" for i in range(len(recent_videos))],
-                            '조회수': [int(v['statistics'].get('viewCount', 0)) for v in recent_videos]
-                        })
-                        st.bar_chart(chart_data.set_index('영상'), height=300)
+                        st.bar_chart(df_stats['조회수'], height=300)
 
                     with chart_col2:
                         st.write("**참여율 추이**")
-                        engagement_data = pd.DataFrame({
-                            '영상': [f"{i+1}" for i in range(len(recent_videos))],
-                            '참여율': [calculate_engagement_rate(v['statistics']) for v in recent_videos]
-                        })
-                        st.line_chart(engagement_data.set_index('영상'), height=300)
+                        st.line_chart(df_stats['참여율'], height=300)
 
                     # 참고사항
                     with st.expander("📝 참고사항"):
-                        st.write("**비용 산정 기준**")
-                        st.write("• 브랜디드 PPL 기준 (제품 1개당 30초~1분 내외 단순 노출)")
-                        st.write("• 단순 언급(Mention)은 30-50% 저렴")
-                        st.write("• 콘텐츠 재사용권 포함 시 20-50% 추가")
-                        st.write("• 독점 계약 시 30-100% 추가 가능")
-                        st.write("")
-                        st.write("**v4.3 개선사항 (2025-11)**")
-                        st.write("• 스마트 티어 시스템 도입 (채널 건강도 평가)")
-                        st.write("• 조회수/구독자 비율 기반 8단계 건강도 측정")
-                        st.write("• 건강도에 따른 가격 조정 (0.3x ~ 1.2x)")
-                        st.write("• 구독자 뻥튀기 문제 해결")
-                        st.write("")
-                        st.write("**v4.2 개선사항 (2025-11)**")
-                        st.write("• 티어별 최소 보장 금액 합리화 (Mega 4,750만→1,500만)")
-                        st.write("• CPM 우선 작동, 티어는 보조 역할로 조정")
-                        st.write("• 브랜드 세이프티 6개 카테고리 체크리스트")
-                        st.write("")
-                        st.write("**v4.1 개선사항**")
-                        st.write("• CPM 기준 30,000원으로 조정 (시장 반영)")
-                        st.write("• 최근 90일 CPM 계산 (죽은 채널 방지)")
-                        st.write("• 참여 질 보정: 댓글/좋아요 비율 분석")
+                        st.markdown(_NOTES_MD)
                         st.caption("데이터 출처: PageOne Formula, Shopify, Descript, ADOPTER Media (2024-2025)")
 
-                    # AI 분석 실행 (버튼이 클릭되었을 때)
-                    if GEMINI_AVAILABLE and gemini_api_loaded and ai_button_clicked:
-                        # 상단 애니메이션 표시 (버튼 바로 밑)
-                        if progress_placeholder_top:
-                            progress_placeholder_top.markdown("""
+                    # AI 결과 표시 (버튼 클릭 시 새로 분석, 이후 재실행(체크박스 등)에서는 세션에 보관한 결과를 다시 표시)
+                    stored_ai = st.session_state.get('ai_analysis')
+                    if stored_ai is not None and stored_ai['key'] != ai_key:
+                        stored_ai = None
+
+                    if GEMINI_AVAILABLE and gemini_api_loaded and (ai_button_clicked or stored_ai is not None):
+                        st.markdown("---")
+                        st.subheader("🤖 AI 브랜드세이프티 점검")
+
+                        if ai_button_clicked:
+                            # 상단 애니메이션 표시 (버튼 바로 밑)
+                            if progress_placeholder_top:
+                                progress_placeholder_top.markdown("""
+                                    <div class="analyzing" style="
+                                        background: linear-gradient(135deg, #e3f2fd 0%, #ffffff 100%);
+                                        padding: 20px;
+                                        border-radius: 12px;
+                                        border-left: 5px solid #1976d2;
+                                        text-align: center;
+                                        margin-top: 15px;
+                                    ">
+                                        <div class="spinner" style="font-size: 3em; margin-bottom: 15px;">🤖</div>
+                                        <div style="font-size: 1.2em; font-weight: bold; color: #1976d2; margin-bottom: 10px;">
+                                            AI 분석 진행 중...
+                                        </div>
+                                        <div style="font-size: 1em; color: #666;">
+                                            브랜드 안전성 검사 및 광고 효과 예측 중입니다 (약 10초 소요)
+                                        </div>
+                                    </div>
+                                    """, unsafe_allow_html=True)
+
+                            # 하단 애니메이션 표시
+                            progress_placeholder_bottom = st.empty()
+                            progress_placeholder_bottom.markdown("""
                                 <div class="analyzing" style="
                                     background: linear-gradient(135deg, #e3f2fd 0%, #ffffff 100%);
                                     padding: 20px;
                                     border-radius: 12px;
                                     border-left: 5px solid #1976d2;
                                     text-align: center;
-                                    margin-top: 15px;
                                 ">
                                     <div class="spinner" style="font-size: 3em; margin-bottom: 15px;">🤖</div>
                                     <div style="font-size: 1.2em; font-weight: bold; color: #1976d2; margin-bottom: 10px;">
@@ -1309,49 +1676,42 @@ if youtube_api_loaded and youtube_api_key:
                                 </div>
                                 """, unsafe_allow_html=True)
 
-                        st.markdown("---")
-                        st.subheader("🤖 AI 브랜드세이프티 점검")
-
-                        # 하단 애니메이션 표시
-                        progress_placeholder_bottom = st.empty()
-                        progress_placeholder_bottom.markdown("""
-                            <div class="analyzing" style="
-                                background: linear-gradient(135deg, #e3f2fd 0%, #ffffff 100%);
-                                padding: 20px;
-                                border-radius: 12px;
-                                border-left: 5px solid #1976d2;
-                                text-align: center;
-                            ">
-                                <div class="spinner" style="font-size: 3em; margin-bottom: 15px;">🤖</div>
-                                <div style="font-size: 1.2em; font-weight: bold; color: #1976d2; margin-bottom: 10px;">
-                                    AI 분석 진행 중...
-                                </div>
-                                <div style="font-size: 1em; color: #666;">
-                                    브랜드 안전성 검사 및 광고 효과 예측 중입니다 (약 10초 소요)
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-
-                        # AI 분석 실행
-                        ai_result = brand_safety_analyzer.analyze_with_gemini(
-                            snippet['title'],
-                            subscriber_count,
-                            avg_views,
-                            avg_engagement_rate,
-                            recent_videos,
-                            cost_data,
-                            gemini_api_loaded
-                        )
-
-                        # 모든 애니메이션 제거
-                        if progress_placeholder_top:
-                            progress_placeholder_top.empty()
-                        progress_placeholder_bottom.empty()
+                            # AI 분석 결과 수신 (버튼 클릭 시 백그라운드로 시작한 작업)
+                            try:
+                                ai_result = ai_future.result()
+                                ai_error = None
+                            except AIAnalysisError as e:
+                                ai_result = None
+                                ai_error = str(e)
+
+                            # 모든 애니메이션 제거
+                            if progress_placeholder_top:
+                                progress_placeholder_top.empty()
+                            progress_placeholder_bottom.empty()
+
+                            # 결과와 지문을 세션에 보관 (같은 결과가 다시 오면 JSON 직렬화/해시 생략)
+                            if ai_result:
+                                if stored_ai is None or stored_ai['result'] != ai_result:
+                                    stored_ai = {
+                                        'result': ai_result,
+                                        'hash': hashlib.blake2b(
+                                            json.dumps(ai_result, sort_keys=True, ensure_ascii=False).encode(),
+                                            digest_size=16
+                                        ).hexdigest(),
+                                    }
+                                st.session_state['ai_analysis'] = {**stored_ai, 'key': ai_key}
+                            else:
+                                st.session_state.pop('ai_analysis', None)
+                        else:
+                            ai_result = stored_ai['result']
+                            ai_error = None
 
-                        # 에러 처리
-                        if ai_result and "error" in ai_result:
-                            st.error(f"AI 분석 중 오류 발생: {ai_result['error']}")
+                        # 에러 처리 (에러는 예외로 전달되어 캐시에 남지 않으므로 다시 누르면 해당 채널만 재시도)
+                        if ai_error:
+                            st.error(f"AI 분석 중 오류 발생: {ai_error}")
                         elif ai_result:
+                            if ai_result.get('heuristic'):
+                                st.info("💡 휴리스틱 판정 (AI 호출 생략): 채널 지표가 기준에 미달하여 AI 분석 없이 판정했습니다.")
 
                             # ============================================
                             # 1단계: 채널 장단점
@@ -1419,206 +1779,80 @@ if youtube_api_loaded and youtube_api_key:
                             st.markdown("---")
                             st.subheader("🛡️ 브랜드 안전성 검사")
                             
-                            safety_score = ai_result['brand_safety']['score']
+                            # 자주 참조하는 하위 항목은 한 번만 꺼내 둠
+                            brand_safety = ai_result.get('brand_safety', {})
+                            risk = ai_result.get('risk_assessment', {})
+                            red_flags = risk.get('red_flags')
+                            concerns = risk.get('concerns')
                             action = ai_result['recommendation']['action']
 
-                            # 점수에 따른 색상 및 상태 결정 (엄격한 기준)
-                            if safety_score >= 90:
-                                safety_color = "#4caf50"
-                                safety_bg = "#e8f5e9"
-                                safety_border = "#4caf50"
-                                safety_status = "매우 안전"
-                                safety_emoji = "🟢"
-                                action_badge = "✅ 광고 집행 적극 권장"
-                                action_color = "#4caf50"
-                            elif safety_score >= 80:
-                                safety_color = "#8bc34a"
-                                safety_bg = "#f1f8e9"
-                                safety_border = "#8bc34a"
-                                safety_status = "안전"
-                                safety_emoji = "🟢"
-                                action_badge = "✅ 광고 집행 가능"
-                                action_color = "#8bc34a"
-                            elif safety_score >= 70:
-                                safety_color = "#ff9800"
-                                safety_bg = "#fff3e0"
-                                safety_border = "#ff9800"
-                                safety_status = "주의 필요"
-                                safety_emoji = "🟡"
-                                action_badge = "⚠️ 신중한 검토 필요"
-                                action_color = "#ff9800"
+                            # 카드 HTML은 세션에 보관한 AI 결과 지문 기준으로 캐시된 것을 재사용
+                            ai_result_hash = st.session_state['ai_analysis']['hash']
+
+                            # 중단 권고 채널은 세부 항목 표시를 선택하지 않으면 대형 카드 + 리스크 목록만 표시
+                            categories_shown = action != "block" or st.session_state.get("show_blocked_details", False)
+
+                            # 휴리스틱 판정은 콘텐츠를 검사하지 않았으므로 안전성 점수 카드 대신 안내만 표시
+                            if not brand_safety:
+                                st.info("💡 콘텐츠 검사를 생략한 판정이라 브랜드 안전성 점수가 없습니다. 아래 주의사항(채널 지표)을 참고하세요.")
                             else:
-                                safety_color = "#f44336"
-                                safety_bg = "#ffebee"
-                                safety_border = "#f44336"
-                                safety_status = "위험"
-                                safety_emoji = "🔴"
-                                action_badge = "🚨 광고 집행 중단 권고"
-                                action_color = "#f44336"
-
-                            # 대형 브랜드 안전성 카드
-                            st.markdown(f"""
-<div style="background: linear-gradient(135deg, {safety_bg} 0%, #ffffff 100%); padding: 30px; border-radius: 15px; border: 3px solid {safety_border}; margin: 20px 0; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-    <div style="display: flex; justify-content: space-between; align-items: center;">
-        <div style="flex: 1; text-align: center;">
-            <div style="font-size: 5em; margin-bottom: 10px;">{safety_emoji}</div>
-            <div style="font-size: 3.5em; font-weight: bold; color: {safety_color}; margin-bottom: 10px;">
-                {safety_score}<span style="font-size: 0.5em; opacity: 0.7;">/100</span>
-            </div>
-            <div style="font-size: 1.3em; color: {safety_color}; font-weight: bold;">
-                {safety_status}
-            </div>
-        </div>
-        <div style="width: 2px; height: 150px; background: rgba(0,0,0,0.1); margin: 0 30px;"></div>
-        <div style="flex: 2;">
-            <div style="background-color: {action_color}; color: white; padding: 15px 25px; border-radius: 10px; font-size: 1.5em; font-weight: bold; text-align: center; margin-bottom: 20px;">
-                {action_badge}
-            </div>
-            <div style="font-size: 1.1em; line-height: 1.6; color: #333;">
-                <strong>평가:</strong> {ai_result['recommendation']['reason']}
-            </div>
-        </div>
-    </div>
-</div>
-                            """, unsafe_allow_html=True)
+                                st.markdown(
+                                    build_safety_html(ai_result_hash, ai_result, with_categories=categories_shown),
+                                    unsafe_allow_html=True
+                                )
 
-                            # 브랜드 안전성 체크리스트 (6개 카테고리)
-                            st.markdown("#### 🔍 브랜드 세이프티 체크리스트")
-
-                            # 6개 카테고리 정의
-                            categories = [
-                                ("content_safety", "📋 1. 콘텐츠 안전성", "선정성, 폭력성, 혐오/차별, 언어"),
-                                ("legal_ethics", "⚖️ 2. 법적/윤리적 리스크", "저작권, 허위정보, 불법 행위, 광고 표시"),
-                                ("reputation", "📊 3. 평판 리스크", "과거 논란, 정치/종교, 구독자 평판"),
-                                ("community", "👥 4. 커뮤니티 건전성", "댓글 관리, 구독자 특성, 타 인플루언서"),
-                                ("brand_fit", "🎯 5. 브랜드 적합성", "가치관 부합, 경쟁사, 광고 품질"),
-                                ("additional_checks", "✅ 6. 추가 확인 사항", "채널 투명성, 콘텐츠 일관성, 플랫폼 정책")
-                            ]
-
-                            # 3열로 표시
-                            for i in range(0, len(categories), 3):
-                                cols = st.columns(3)
-                                for j in range(3):
-                                    if i + j < len(categories):
-                                        key, title, desc = categories[i + j]
-
-                                        with cols[j]:
-                                            if key in ai_result:
-                                                category_data = ai_result[key]
-                                                score = category_data.get('score', 0)
-                                                issues = category_data.get('issues', [])
-
-                                                # 점수에 따른 색상 (엄격한 기준)
-                                                if score >= 90:
-                                                    color = "#4caf50"
-                                                    bg = "#e8f5e9"
-                                                    status_text = "우수"
-                                                elif score >= 80:
-                                                    color = "#8bc34a"
-                                                    bg = "#f1f8e9"
-                                                    status_text = "양호"
-                                                elif score >= 70:
-                                                    color = "#ff9800"
-                                                    bg = "#fff3e0"
-                                                    status_text = "보통"
-                                                else:
-                                                    color = "#f44336"
-                                                    bg = "#ffebee"
-                                                    status_text = "위험"
-
-                                                # 이슈 표시
-                                                issues_html = ""
-                                                if issues:
-                                                    issues_html = "<br>".join([f"• {issue}" for issue in issues])
-                                                else:
-                                                    issues_html = "• 특이사항 없음"
-
-                                                st.markdown(f"""
-                                                <div style="background-color: {bg}; padding: 15px; border-radius: 10px; border-left: 4px solid {color}; margin-bottom: 15px; height: 100%;">
-                                                    <div style="font-weight: bold; margin-bottom: 8px; color: {color};">
-                                                        {title}
-                                                    </div>
-                                                    <div style="font-size: 2em; font-weight: bold; color: {color}; margin: 10px 0;">
-                                                        {score}<span style="font-size: 0.5em; opacity: 0.7;">/100</span>
-                                                    </div>
-                                                    <div style="font-size: 0.9em; color: #666; margin-bottom: 8px;">
-                                                        {desc}
-                                                    </div>
-                                                    <div style="font-size: 0.85em; color: #555;">
-                                                        {issues_html}
-                                                    </div>
-                                                </div>
-                                                """, unsafe_allow_html=True)
-
-                            # 기존 4개 체크리스트 (호환성 유지)
-                            if 'checklist' in ai_result.get('brand_safety', {}):
+                            # 기존 4개 체크리스트 (호환성 유지, 선택 시에만 표시)
+                            if categories_shown and 'checklist' in brand_safety and st.session_state.get("show_legacy_checklist", False):
                                 st.markdown("---")
                                 st.markdown("##### 상세 체크리스트")
 
-                                checklist = ai_result['brand_safety']['checklist']
+                                checklist = brand_safety['checklist']
                                 check_col1, check_col2 = st.columns(2)
 
-                                checklist_items = [
-                                    ("inappropriate_content", "부적절한 콘텐츠"),
-                                    ("controversial_topics", "논란성 주제"),
-                                    ("profanity", "비속어/욕설"),
-                                    ("brand_alignment", "브랜드 부합도")
-                                ]
-
-                                for idx, (key, label) in enumerate(checklist_items):
-                                    col = check_col1 if idx % 2 == 0 else check_col2
-
-                                    with col:
-                                        if key in checklist:
-                                            item = checklist[key]
-                                            status = item.get('status', 'unknown')
-                                            detail = item.get('detail', '정보 없음')
-
-                                            if status == "pass":
-                                                icon = "✅"
-                                                bg_color = "#e8f5e9"
-                                                border_color = "#4caf50"
-                                            elif status == "warning":
-                                                icon = "⚠️"
-                                                bg_color = "#fff3e0"
-                                                border_color = "#ff9800"
-                                            else:
-                                                icon = "❌"
-                                                bg_color = "#ffebee"
-                                                border_color = "#f44336"
-
-                                            st.markdown(f"""
-                                            <div style="background-color: {bg_color}; padding: 12px; border-radius: 8px; border-left: 4px solid {border_color}; margin-bottom: 10px;">
-                                                <div style="font-size: 1.1em; font-weight: bold; margin-bottom: 5px;">
-                                                    {icon} {label}
-                                                </div>
-                                                <div style="font-size: 0.95em; color: #666;">
-                                                    {detail}
-                                                </div>
-                                            </div>
-                                            """, unsafe_allow_html=True)
+                                # 항목별 HTML (없는 항목은 빈 문자열로 자리만 유지)
+                                checklist_html = []
+                                for key, label in _LEGACY_CHECKLIST_ITEMS:
+                                    if key not in checklist:
+                                        checklist_html.append("")
+                                        continue
+
+                                    item = checklist[key]
+                                    status = item.get('status', 'unknown')
+                                    detail = item.get('detail', '정보 없음')
+
+                                    # 상태별 아이콘/색상 (pass/warning 외에는 모두 fail 스타일)
+                                    style = _CHECK_STATUS_STYLES.get(status, _CHECK_STATUS_STYLES['fail'])
+
+                                    checklist_html.append(_CHECKLIST_ITEM_TMPL.format_map({
+                                        **style,
+                                        'label': label,
+                                        'detail': detail,
+                                    }))
+
+                                # 짝수 번째는 왼쪽, 홀수 번째는 오른쪽 열에 한 번씩만 출력
+                                with check_col1:
+                                    st.markdown("".join(checklist_html[0::2]), unsafe_allow_html=True)
+                                with check_col2:
+                                    st.markdown("".join(checklist_html[1::2]), unsafe_allow_html=True)
 
                             # 리스크가 있는 경우 경고 표시
-                            if ai_result['risk_assessment'].get('red_flags'):
+                            if red_flags:
                                 st.error("🚩 **발견된 브랜드 리스크**")
-                                for flag in ai_result['risk_assessment']['red_flags']:
-                                    st.markdown(f"""
-                                    <div style="background-color: #ffebee; padding: 15px; border-radius: 8px; margin: 10px 0; border-left: 5px solid #f44336;">
-                                        <strong>⚠️ {flag}</strong>
-                                    </div>
-                                    """, unsafe_allow_html=True)
+                                st.markdown(
+                                    "".join(_RISK_FLAG_TMPL.format(flag=flag) for flag in red_flags),
+                                    unsafe_allow_html=True
+                                )
 
-                                # 중단 권고 시 여기서 멈춤
-                                if action == "block":
-                                    st.info("💡 이 채널은 브랜드 이미지에 부정적 영향을 줄 수 있어 광고 집행을 권장하지 않습니다.")
-                                    st.stop()
+                            # 중단 권고 시 여기서 멈춤
+                            if action == "block":
+                                st.info("💡 이 채널은 브랜드 이미지에 부정적 영향을 줄 수 있어 광고 집행을 권장하지 않습니다.")
+                                st.stop()
 
                             # 주의 필요 시 경고
-                            if action == "caution" and ai_result['risk_assessment'].get('concerns'):
+                            if action == "caution" and concerns:
                                 with st.expander("⚠️ 주의사항 확인", expanded=True):
                                     st.warning("이 채널은 일부 주의사항이 있습니다. 신중한 검토 후 광고 집행을 결정하세요.")
-                                    for concern in ai_result['risk_assessment']['concerns']:
-                                        st.write(f"• {concern}")
+                                    st.markdown("\n\n".join(f"• {concern}" for concern in concerns))
 
                 else:
                     st.warning("⚠️ 최근 영상 정보를 가져올 수 없습니다.")